@@ -4,100 +4,60 @@ Requiere: matplotlib, numpy
 Instalar con: pip install matplotlib numpy
 """
 
-import time
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import List
-from division_parrafos import DivisionParrafos
-import json
+from medicion_rendimiento import (ejecutar_benchmark, documento_resultados, guardar_resultados,
+                                  ajustar_complejidades, EXPONENTES_TEORICOS)
 import math
 
 
 
 class AnalizadorRendimiento:
     """Clase para analizar y comparar el rendimiento de los algoritmos"""
+
+    COLORES = {
+        'Iterativo': '#2ecc71',
+        'Iterativo Acotado': '#16a085',
+        'NumPy': '#f39c12',
+        'Recursivo Memo': '#e67e22',
+        'Divide y Vencerás': '#3498db',
+        'Recursivo': '#e74c3c',
+        'Exhaustivo': '#9b59b6'
+    }
+    # Color de cada algoritmo en todas las gráficas
     
     def __init__(self):
         self.resultados = []
+        self.documento = None
     
-    def ejecutar_benchmark(self, tamaños: List[int], L: int = 20, b: float = 2.0):
+    def ejecutar_benchmark(self, tamaños: List[int], L: int = 20, b: float = 2.0,
+                           repeticiones: int = 10, calentamiento: int = 2, memoria: bool = True):
         """
         Ejecuta benchmarks para diferentes tamaños de entrada.
+
+        Cada algoritmo se mide con medicion_rendimiento (calentamiento,
+        repeticiones y GC desactivado); el 'tiempo' de cada resultado es la
+        mediana, y se guardan también min, p95 y las muestras atípicas.
         
         Args:
             tamaños: Lista de tamaños de entrada a probar
             L: Longitud de línea
             b: Amplitud ideal de espacios
+            repeticiones: Muestras por algoritmo y tamaño
+            calentamiento: Ejecuciones previas sin medir
+            memoria: Mide también el pico de memoria de cada algoritmo con
+                tracemalloc, en una ejecución aparte
         """
         print("=" * 80)
         print("BENCHMARK: Análisis de Rendimiento por Tamaño de Entrada")
         print("=" * 80)
-        
-        for n in tamaños:
-            print(f"\nProbando con n={n} palabras...")
-            
-            # Generar palabras aleatorias pero reproducibles
-            np.random.seed(42)
-            palabras = np.random.randint(2, 8, size=n).tolist()
-            
-            dp = DivisionParrafos(palabras, L, b)
-            
-            resultado = {
-                'n': n,
-                'algoritmos': {}
-            }
-            
-            # Iterativo (siempre ejecutar)
-            print(" Ejecutando Iterativo...")
-            inicio = time.perf_counter()
-            costo_iter, _ = dp.resolver_iterativo()
-            tiempo_iter = time.perf_counter() - inicio
-            resultado['algoritmos']['Iterativo'] = {
-                'tiempo': tiempo_iter,
-                'costo': costo_iter
-            }
-            print(f"     ✓ Completado en {tiempo_iter*1000:.2f} ms")
-            
-            # Divide y Vencerás (siempre ejecutar)
-            print("  Ejecutando Divide y Vencerás...")
-            inicio = time.perf_counter()
-            costo_dyv, _ = dp.resolver_divide_venceras()
-            tiempo_dyv = time.perf_counter() - inicio
-            resultado['algoritmos']['Divide y Vencerás'] = {
-                'tiempo': tiempo_dyv,
-                'costo': costo_dyv
-            }
-            print(f"     ✓ Completado en {tiempo_dyv*1000:.2f} ms")
-            
-            # Recursivo (solo para n pequeño)
-            if n <= 8:
-                print("   Ejecutando Recursivo Puro...")
-                inicio = time.perf_counter()
-                costo_rec, _ = dp.resolver_recursivo()
-                tiempo_rec = time.perf_counter() - inicio
-                resultado['algoritmos']['Recursivo'] = {
-                    'tiempo': tiempo_rec,
-                    'costo': costo_rec
-                }
-                print(f"     ✓ Completado en {tiempo_rec*1000:.2f} ms")
-            else:
-                print("    Recursivo omitido (n demasiado grande)")
-            
-            # Exhaustivo (solo para n muy pequeño)
-            if n <= 5:
-                print("    Ejecutando Exhaustivo...")
-                inicio = time.perf_counter()
-                costo_exh, _ = dp.resolver_exhaustivo()
-                tiempo_exh = time.perf_counter() - inicio
-                resultado['algoritmos']['Exhaustivo'] = {
-                    'tiempo': tiempo_exh,
-                    'costo': costo_exh
-                }
-                print(f"     ✓ Completado en {tiempo_exh*1000:.2f} ms")
-            else:
-                print("      Exhaustivo omitido (n demasiado grande)")
-            
-            self.resultados.append(resultado)
+
+        # Recursivo puro solo con n <= 8 y exhaustivo con n <= 5
+        self.documento = ejecutar_benchmark(tamaños, L, b, repeticiones=repeticiones,
+                                            calentamiento=calentamiento, memoria=memoria)
+        self.resultados.extend(self.documento['resultados'])
+        self.documento['resultados'] = self.resultados
     
     def generar_graficas(self, guardar: bool = True, filename: str = 'analisis_division_parrafos.png'):
         """Genera todas las gráficas de análisis"""
@@ -107,32 +67,36 @@ class AnalizadorRendimiento:
         
         # Configuración general
         plt.style.use('seaborn-v0_8-darkgrid')
-        plt.figure(figsize=(16, 12))
+        plt.figure(figsize=(16, 17))
         
         # 1. Gráfica de tiempo vs tamaño (escala logarítmica)
-        ax1 = plt.subplot(2, 3, 1)
+        ax1 = plt.subplot(3, 3, 1)
         self._grafica_tiempo_vs_n(ax1, log_scale=True)
         
         # 2. Gráfica de tiempo vs tamaño (escala lineal)
-        ax2 = plt.subplot(2, 3, 2)
+        ax2 = plt.subplot(3, 3, 2)
         self._grafica_tiempo_vs_n(ax2, log_scale=False)
         
         # 3. Comparación de costos
-        ax3 = plt.subplot(2, 3, 3)
+        ax3 = plt.subplot(3, 3, 3)
         self._grafica_comparacion_costos(ax3)
         
         # 4. Speedup relativo
-        ax4 = plt.subplot(2, 3, 4)
+        ax4 = plt.subplot(3, 3, 4)
         self._grafica_speedup(ax4)
         
         # 5. Tiempo acumulado
-        ax5 = plt.subplot(2, 3, 5)
+        ax5 = plt.subplot(3, 3, 5)
         self._grafica_tiempo_acumulado(ax5)
         
         # 6. Comparación Valor vs Bits
-        ax6 = plt.subplot(2, 3, 6)
+        ax6 = plt.subplot(3, 3, 6)
         self._grafica_valor_vs_bits(ax6)
         
+        # 7. Pico de memoria vs tamaño (toda la última fila)
+        ax7 = plt.subplot(3, 1, 3)
+        self._grafica_memoria_vs_n(ax7)
+        
         plt.tight_layout()
         
         if guardar:
@@ -152,18 +116,11 @@ class AnalizadorRendimiento:
                 algoritmos[alg_nombre]['n'].append(res['n'])
                 algoritmos[alg_nombre]['tiempo'].append(alg_datos['tiempo'] * 1000)  # ms
         
-        colores = {
-            'Iterativo': '#2ecc71',
-            'Divide y Vencerás': '#3498db',
-            'Recursivo': '#e74c3c',
-            'Exhaustivo': '#9b59b6'
-        }
-        
         for alg_nombre, datos in algoritmos.items():
             ax.plot(
                 datos['n'], datos['tiempo'],
                 marker='o', linewidth=2, markersize=8,
-                label=alg_nombre, color=colores.get(alg_nombre, 'gray')
+                label=alg_nombre, color=self.COLORES.get(alg_nombre, 'gray')
             )
         
         if log_scale:
@@ -229,7 +186,7 @@ class AnalizadorRendimiento:
     def _grafica_speedup(self, ax):
         """Gráfica de speedup del iterativo vs otros algoritmos"""
         n_values = []
-        speedups = {'Recursivo': [], 'Exhaustivo': [], 'Divide y Vencerás': []}
+        speedups = {'Recursivo': [], 'Recursivo Memo': [], 'Exhaustivo': [], 'Divide y Vencerás': []}
         
         for res in self.resultados:
             if 'Iterativo' not in res['algoritmos']:
@@ -238,7 +195,7 @@ class AnalizadorRendimiento:
             n_values.append(res['n'])
             tiempo_iter = res['algoritmos']['Iterativo']['tiempo']
             
-            for alg_nombre in ['Recursivo', 'Exhaustivo', 'Divide y Vencerás']:
+            for alg_nombre in speedups:
                 if alg_nombre in res['algoritmos']:
                     tiempo_alg = res['algoritmos'][alg_nombre]['tiempo']
                     speedup = tiempo_alg / tiempo_iter if tiempo_iter > 0 else 0
@@ -357,6 +314,39 @@ class AnalizadorRendimiento:
         ax2.legend(loc='upper right')
         ax.grid(True, alpha=0.3)
 
+    def _grafica_memoria_vs_n(self, ax):
+        """Gráfica del pico de memoria (tracemalloc) vs tamaño de entrada"""
+        algoritmos = {}
+        
+        for res in self.resultados:
+            for alg_nombre, alg_datos in res['algoritmos'].items():
+                if not alg_datos.get('memoria'):
+                    continue
+                datos = algoritmos.setdefault(alg_nombre, {'n': [], 'pico': []})
+                datos['n'].append(res['n'])
+                datos['pico'].append(alg_datos['memoria']['pico'] / 1024)  # KiB
+        
+        ax.set_title('Pico de Memoria vs Tamaño (tracemalloc)', fontsize=12, fontweight='bold')
+        if not algoritmos:
+            ax.text(0.5, 0.5, 'Sin mediciones de memoria\n(ejecutar_benchmark con memoria=True)',
+                    ha='center', va='center', transform=ax.transAxes)
+            ax.set_axis_off()
+            return
+        
+        for alg_nombre, datos in algoritmos.items():
+            ax.plot(
+                datos['n'], datos['pico'],
+                marker='s', linewidth=2, markersize=7,
+                label=alg_nombre, color=self.COLORES.get(alg_nombre, 'gray')
+            )
+        
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Número de palabras (n)', fontsize=10)
+        ax.set_ylabel('Pico de memoria (KiB)', fontsize=10)
+        ax.legend()
+        ax.grid(True, alpha=0.3, which='both')
+
     def generar_tabla_comparativa(self):
         """Genera una tabla comparativa de resultados"""
         print("\n" + "=" * 120)
@@ -376,7 +366,11 @@ class AnalizadorRendimiento:
                 costo = alg_datos['costo']
                 
                 # Determinar complejidades según algoritmo
-                if 'Iterativo' in alg_nombre or 'Divide' in alg_nombre:
+                if ('Acotado' in alg_nombre or 'NumPy' in alg_nombre or 'Memo' in alg_nombre
+                        or 'Divide' in alg_nombre):
+                    comp_valor = "O(n·W)"
+                    comp_bits = "O(2^b·W)"
+                elif 'Iterativo' in alg_nombre:
                     comp_valor = "O(n²)"
                     comp_bits = "O(2^(2b))"
                 elif 'Recursivo' in alg_nombre:
@@ -386,10 +380,14 @@ class AnalizadorRendimiento:
                     comp_valor = "O(B(n))"
                     comp_bits = "O(B(2^b))"
                 
+                # Mediciones con mucha dispersión entre repeticiones
+                aviso = " ⚠" if alg_datos.get('inestable') else ""
                 print(f"{n:<5} | {bits:<6} | {alg_nombre:<20} | {tiempo_ms:>10.4f} | "
-                      f"{costo:>8.4f} | {comp_valor:<15} | {comp_bits:<15}")
+                      f"{costo:>8.4f} | {comp_valor:<15} | {comp_bits:<15}{aviso}")
             
             print("-" * 120)
+
+        print("Tiempo: mediana de las repeticiones (⚠ = medición inestable o con muestras atípicas)")
     
     def analisis_complejidad_dual(self):
         """Genera análisis comparando perspectiva de valor vs bits"""
@@ -426,9 +424,11 @@ class AnalizadorRendimiento:
     
     
     def guardar_resultados_json(self, filename: str = 'resultados_benchmark.json'):
-        """Guarda los resultados en formato JSON"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.resultados, f, indent=2, ensure_ascii=False)
+        """Guarda los resultados en formato JSON (versionado, ver medicion_rendimiento)"""
+        documento = self.documento
+        if documento is None or documento['resultados'] is not self.resultados:
+            documento = documento_resultados(self.resultados, documento and documento['configuracion'])
+        guardar_resultados(documento, filename)
         print(f"\n✅ Resultados guardados en '{filename}'")
     
     def generar_informe_completo(self):
@@ -443,7 +443,8 @@ class AnalizadorRendimiento:
         print("-" * 100)
         print(f"{'Iterativo (DP)':<25} | {'O(n²)':<15} | {'O(n)':<15} | Óptimo, bottom-up")
         print(f"{'Recursivo Puro':<25} | {'O(2ⁿ)':<15} | {'O(n)':<15} | Exponencial, sin memo")
-        print(f"{'Divide y Vencerás':<25} | {'O(n²)':<15} | {'O(n²)':<15} | Con memoización")
+        print(f"{'Recursivo Memo':<25} | {'O(n·W)':<15} | {'O(n)':<15} | Memo + poda por ancho")
+        print(f"{'Divide y Vencerás':<25} | {'O(n·W)':<15} | {'O(n)':<15} | Pila explícita + memo por inicio")
         print(f"{'Exhaustivo':<25} | {'O(B(n))':<15} | {'O(n)':<15} | Bell number, muy lento")
         
         print("\nANÁLISIS DE RESULTADOS EXPERIMENTALES:")
@@ -468,14 +469,25 @@ class AnalizadorRendimiento:
             if iter_times and dyv_times:
                 ratio = np.mean(dyv_times) / np.mean(iter_times)
                 print(f"Ratio D&V/Iterativo: {ratio:.2f}x")
+
+            # Exponente empírico: tiempo ≈ c·n^k ajustado en escala log-log
+            ajustes = ajustar_complejidades({'resultados': self.resultados})
+            if ajustes:
+                print("\nCOMPLEJIDAD EMPÍRICA (tiempo ≈ c·n^k, intervalo de confianza del 95%):")
+                for nombre, ajuste in ajustes.items():
+                    bajo, alto = ajuste['ic95']
+                    teorico = EXPONENTES_TEORICOS.get(nombre)
+                    esperado = f" (teórico {teorico:.0f})" if teorico is not None else ""
+                    print(f"  {nombre:<20} k = {ajuste['exponente']:.2f} "
+                          f"[{bajo:.2f}, {alto:.2f}], R² = {ajuste['r2']:.3f}{esperado}")
         
         print("\n✅ CONCLUSIONES:")
         print("-" * 100)
-        print("1. El algoritmo ITERATIVO (Programación Dinámica) es el más eficiente")
+        print("1. El ITERATIVO completo es O(n²): prueba todos los inicios de línea, quepan o no")
         print("2. Recursivo puro es impracticable para n > 10")
         print("3. Exhaustivo solo sirve para demostración con n <= 5")
-        print("4. Divide y Vencerás tiene rendimiento similar a Iterativo pero más overhead")
-        print("5. Para producción: usar ITERATIVO")
+        print("4. Divide y Vencerás y Recursivo Memo son O(n·W): superan al Iterativo O(n²) en párrafos largos")
+        print("5. Para producción: ITERATIVO ACOTADO (acotado=True), O(n·W) sin la pila de Divide y Vencerás")
 
 
 def main():
@@ -7,11 +7,16 @@ import sys
 #Controla la salida del programa y obtiene rutas del intérprete Python
 import os
 #Permite ejecutar comandos del sistema operativo
-import subprocess
-#Ejecuta comandos externos como pytest
-from typing import Optional
-#Define tipos de datos opcionales para mejor documentación
 import time
+from importlib.util import find_spec
+#Comprueba si un módulo está instalado sin importarlo
+
+# Los módulos pesados (division_parrafos, analisis_graficas con matplotlib,
+# numpy, pytest) se importan dentro de cada opción del menú, solo cuando se
+# usan
+
+PRESUPUESTO_ARRANQUE_MS = 50
+# Tiempo máximo de importación (python -X importtime) de main y del solver
 
 class MenuPrincipal:
     """Menú interactivo para el proyecto"""
@@ -26,6 +31,7 @@ class MenuPrincipal:
             '6': ('Ejecutar TODO (casos + análisis + tests)', self.ejecutar_todo),
             '7': ('Ejemplo personalizado', self.ejemplo_personalizado),
             '8': ('Stress test con entradas grandes', self.ejecutar_casos_grandes),
+            '9': ('Formatear un documento de texto', self.formatear_documento),
             '0': ('Salir', None)
         }
     
@@ -145,14 +151,14 @@ class MenuPrincipal:
         print("""
 Este proyecto implementa 4 algoritmos para el problema de División en Párrafos:
 
-1. ITERATIVO (Programación Dinámica) - O(n²)
-   Más eficiente, recomendado para producción
+1. ITERATIVO (Programación Dinámica) - O(n²), acotado O(n·W)
+   El modo acotado es el recomendado para producción
    
 2. RECURSIVO PURO - O(2ⁿ)
    Exponencial, solo para demostración (n ≤ 10)
    
-3. DIVIDE Y VENCERÁS - O(n²)
-   ✅ Alternativa válida con memoización
+3. DIVIDE Y VENCERÁS - O(n·W), memoria O(n)
+   ✅ Alternativa válida: pila explícita y memo por inicio
    
 4. EXHAUSTIVO - O(B(n))
    ❌ Extremadamente lento, solo n ≤ 5
@@ -161,6 +167,7 @@ ARCHIVOS PRINCIPALES:
 - division_parrafos.py       : Implementación de algoritmos
 - test_division_parrafos.py  : Suite de pruebas (pytest)
 - analisis_graficas.py       : Análisis y visualización
+- medicion_rendimiento.py    : Motor de benchmark (repeticiones, min/mediana/p95)
 - main.py                    : Este menú interactivo
 
 RESULTADOS GENERADOS:
@@ -220,8 +227,10 @@ Para más información, consulta README.md
                 
                 palabras_texto = entrada.split()
             
-                # Calcular longitudes
-                palabras = [len(p) for p in palabras_texto]
+                # Calcular longitudes (columnas en pantalla: los caracteres
+                # anchos cuentan doble)
+                from division_parrafos import ancho_visual
+                palabras = [ancho_visual(p) for p in palabras_texto]
             
                 print(f"\nPalabras ingresadas: {palabras_texto}")
                 print(f"Longitudes calculadas: {palabras}")
@@ -269,7 +278,8 @@ Para más información, consulta README.md
             from division_parrafos import DivisionParrafos
             import time
         
-            dp = DivisionParrafos(palabras, L, b)
+            # Caché de costos: el análisis posterior reutiliza los mismos (i, j)
+            dp = DivisionParrafos(palabras, L, b, tam_cache=1 << 16)
         
             # DEBUG: Mostrar algunos costos de ejemplo
             print(f"\nDEBUG - Costos de ejemplo:")
@@ -323,7 +333,7 @@ Para más información, consulta README.md
         
             # Mostrar solución
             if palabras_texto:
-                self._mostrar_solucion_con_palabras(palabras_texto, palabras, cortes, L, b)
+                self._mostrar_solucion_con_palabras(palabras_texto, palabras, cortes, L, b, dp)
             else:
                 self._mostrar_solucion_solo_longitudes(palabras, cortes, L, b)
             
@@ -337,15 +347,17 @@ Para más información, consulta README.md
     
         self.pausar()
 
-    def _mostrar_solucion_con_palabras(self, palabras_texto, longitudes, cortes, L, b):
+    def _mostrar_solucion_con_palabras(self, palabras_texto, longitudes, cortes, L, b, dp=None):
         """Muestra la solución cuando el usuario ingresó palabras reales"""
         print("\n" + "=" * 80)
         print("PÁRRAFOS FORMATEADOS (con tus palabras):")
         print("=" * 80)
         
-        # Crear objeto DivisionParrafos para cálculos consistentes
-        from division_parrafos import DivisionParrafos
-        dp = DivisionParrafos(longitudes, L, b)
+        # Crear objeto DivisionParrafos para cálculos consistentes (o reusar
+        # el del cálculo, con sus costos en caché)
+        if dp is None:
+            from division_parrafos import DivisionParrafos
+            dp = DivisionParrafos(longitudes, L, b)
         
         # Reconstruir todas las líneas para análisis
         lineas = []
@@ -444,6 +456,10 @@ Para más información, consulta README.md
         print(f"   • Costo total calculado: {costo_total_calculado:.4f}")
         print(f"   • Costo óptimo reportado: {costo_optimo:.4f}")
         print(f"   • Eficiencia promedio: {sum(longitudes) / (len(lineas) * L) * 100:.1f}%")
+        estadisticas = dp.estadisticas_cache()
+        if estadisticas:
+            print(f"   • Caché de costos: {estadisticas['aciertos']} aciertos, "
+                  f"{estadisticas['fallos']} fallos")
         
         if abs(costo_total_calculado - costo_optimo) > 0.001:
             print("   ADVERTENCIA: Los costos no coinciden. Puede haber error en la reconstrucción.")
@@ -501,103 +517,30 @@ Para más información, consulta README.md
         """
         Ejecuta ejemplos con entradas muy grandes para testear el comportamiento
         de las implementaciones (stress test) y genera gráficas de n vs tiempo.
+
+        Usa medicion_rendimiento.ejecutar_stress: sin preguntas, con semilla
+        fija, un proceso por medición y un tiempo límite por medición. Si se
+        interrumpe, la siguiente ejecución continúa desde
+        resultados_benchmark_stress.json.
         """
         print("\nSTRESS TEST CON ENTRADAS GRANDES")
         print("=" * 80)
 
-        from division_parrafos import DivisionParrafos, ejecutar_y_medir
+        from medicion_rendimiento import ejecutar_stress, TAMAÑOS_STRESS
         from analisis_graficas import AnalizadorRendimiento
-        import random
 
-        # Tamaños grandes: de 500 en 500 hasta 3500
-        tamanos = list(range(500, 3501, 500))  # [500, 1000, ..., 5000]
-        L = 60    # longitud de línea fija para las pruebas
-        b = 1.5   # amplitud ideal de espacios
-
-        resultados_stress = []
-
-        for n in tamanos:
-            print(f"\nInstancia con n = {n} palabras")
-            print("-" * 80)
-            # Longitudes aleatorias de palabras entre 2 y 10 caracteres
-            palabras = [random.randint(2, 10) for _ in range(n)]
-            print(f"Primeras 10 longitudes: {palabras[:10]} ...")
-            print(f"L = {L}, b = {b}")
-
-            dp = DivisionParrafos(palabras, L, b)
-
-            resultados_alg = []
-            resultado_n = {
-                'n': n,
-                'algoritmos': {}
-            }
-
-            # Iterativo
-            res_iter = ejecutar_y_medir(dp.resolver_iterativo, f"Iterativo (DP)      n={n}")
-            resultados_alg.append(res_iter)
-            if res_iter['exito'] and res_iter['costo'] is not None:
-                resultado_n['algoritmos']['Iterativo'] = {
-                    'tiempo': res_iter['tiempo'],
-                    'costo': res_iter['costo']
-                }
-
-            # Divide y Vencerás
-            res_dyv = ejecutar_y_medir(dp.resolver_divide_venceras, f"Divide y Vencerás  n={n}")
-            resultados_alg.append(res_dyv)
-            if res_dyv['exito'] and res_dyv['costo'] is not None:
-                resultado_n['algoritmos']['Divide y Vencerás'] = {
-                    'tiempo': res_dyv['tiempo'],
-                    'costo': res_dyv['costo']
-                }
-
-            # Opcional: también recursivo y exhaustivo si el usuario quiere
-            resp = input(
-                "\n¿Intentar también Recursivo Puro y Exhaustivo para este tamaño? "
-                "(puede tardar MUCHÍSIMO o no terminar) [s/N]: "
-            ).strip().lower()
-
-            if resp == "s":
-                res_rec = ejecutar_y_medir(dp.resolver_recursivo, f"Recursivo Puro      n={n}")
-                resultados_alg.append(res_rec)
-                if res_rec['exito'] and res_rec['costo'] is not None:
-                    resultado_n['algoritmos']['Recursivo'] = {
-                        'tiempo': res_rec['tiempo'],
-                        'costo': res_rec['costo']
-                    }
-
-                res_exh = ejecutar_y_medir(dp.resolver_exhaustivo, f"Exhaustivo          n={n}")
-                resultados_alg.append(res_exh)
-                if res_exh['exito'] and res_exh['costo'] is not None:
-                    resultado_n['algoritmos']['Exhaustivo'] = {
-                        'tiempo': res_exh['tiempo'],
-                        'costo': res_exh['costo']
-                    }
-
-            print("\nResumen de resultados (n = {}):".format(n))
-            print("-" * 80)
-            for res in resultados_alg:
-                if res["exito"]:
-                    costo_str = f"{res['costo']:.4f}" if res["costo"] is not None else "N/A"
-                    print(
-                        f"{res['nombre']:30} | "
-                        f"Costo: {costo_str:>10} | "
-                        f"Tiempo: {res['tiempo']*1000:10.4f} ms"
-                    )
-                else:
-                    print(f"{res['nombre']:30} | ERROR: {res['error']}")
-
-            resultados_stress.append(resultado_n)
-
-        print("\nStress test finalizado.")
+        # Tamaños grandes: de 500 en 500 hasta 3500, L = 60 y b = 1.5
+        documento = ejecutar_stress(TAMAÑOS_STRESS, L=60, b=1.5, semilla=42, tiempo_limite=60.0)
+        resultados_stress = documento['resultados']
 
         # ----- Generar gráficas y tabla para estos resultados grandes -----
         print("\nGenerando análisis y gráficas del stress test (n grandes)...")
         analizador = AnalizadorRendimiento()
         analizador.resultados = resultados_stress
+        analizador.documento = documento
 
-        # Tabla comparativa y JSON específico del stress test
+        # Tabla comparativa (el JSON del stress test ya se guardó como checkpoint)
         analizador.generar_tabla_comparativa()
-        analizador.guardar_resultados_json('resultados_benchmark_stress.json')
 
         # Gráficas específicas del stress test
         analizador.generar_graficas(
@@ -607,6 +550,42 @@ Para más información, consulta README.md
 
         self.pausar()
     
+    def formatear_documento(self):
+        """Justifica todos los párrafos de un archivo de texto UTF-8"""
+        print("\nFORMATEAR DOCUMENTO")
+        print("-" * 80)
+
+        from division_parrafos import formatear_documento
+
+        try:
+            ruta = input("Archivo de texto: ").strip()
+            if not os.path.isfile(ruta):
+                print(f"❌ No existe el archivo {ruta}")
+                self.pausar()
+                return
+            L = int(input("Longitud de línea L (ej. 70): ").strip() or 70)
+            b = float(input("Espacio ideal b (ej. 1.0): ").strip() or 1.0)
+            destino = input("Archivo de salida (vacío para mostrar en pantalla): ").strip()
+
+            if destino:
+                with open(destino, 'w', encoding='utf-8') as salida:
+                    resumen = formatear_documento(ruta, L, b, salida)
+                print(f"\n✅ Resultado escrito en {destino}")
+            else:
+                print("=" * 80)
+                resumen = formatear_documento(ruta, L, b)
+                print("=" * 80)
+
+            print(f"\nPárrafos: {resumen['parrafos']}, palabras: {resumen['palabras']}, "
+                  f"líneas: {resumen['lineas']}")
+            print(f"Costo total: {resumen['costo']:.4f}")
+            print(f"Tiempo: {resumen['tiempo']:.3f} s "
+                  f"({resumen['mb_por_segundo']:.2f} MB/s sobre {resumen['bytes']} bytes)")
+        except ValueError as e:
+            print(f"\n❌ Error en la entrada: {e}")
+
+        self.pausar()
+
     def pausar(self):
         """Pausa la ejecución esperando input del usuario"""
         input("\nPresiona ENTER para continuar...")
@@ -648,13 +627,9 @@ def verificar_dependencias():
         'numpy': 'numpy'
     }
     
-    faltantes = []
-    
-    for modulo, nombre_pip in dependencias.items():
-        try:
-            __import__(modulo)
-        except ImportError:
-            faltantes.append(nombre_pip)
+    # find_spec solo busca el módulo; importarlos tardaría cerca de un segundo
+    faltantes = [nombre_pip for modulo, nombre_pip in dependencias.items()
+                 if find_spec(modulo) is None]
     
     if faltantes:
         print("\nADVERTENCIA: Faltan dependencias")
@@ -670,8 +645,42 @@ def verificar_dependencias():
             sys.exit(1)
 
 
+def medir_arranque(modulo: str = 'division_parrafos', repeticiones: int = 3) -> float:
+    """
+    Milisegundos que tarda en importarse un módulo en un intérprete nuevo,
+    según python -X importtime (el mínimo de varias repeticiones).
+    """
+    import subprocess
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    tiempos = []
+    for _ in range(repeticiones):
+        proceso = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+                                 capture_output=True, text=True, cwd=directorio, check=True)
+        # Cada línea: "import time: propio | acumulado | módulo" (en µs)
+        for linea in proceso.stderr.splitlines():
+            partes = linea.split('|')
+            if len(partes) == 3 and partes[2].strip() == modulo:
+                tiempos.append(int(partes[1]) / 1000)
+    return min(tiempos)
+
+
+def verificar_arranque() -> bool:
+    """Compara el tiempo de importación de main y del solver con PRESUPUESTO_ARRANQUE_MS"""
+    dentro = True
+    for modulo in ('main', 'division_parrafos'):
+        tiempo = medir_arranque(modulo)
+        ok = tiempo <= PRESUPUESTO_ARRANQUE_MS
+        dentro = dentro and ok
+        print(f"{'✅' if ok else '❌'} import {modulo}: {tiempo:.1f} ms (presupuesto {PRESUPUESTO_ARRANQUE_MS} ms)")
+    return dentro
+
+
 def main():
     """Función principal"""
+    if '--arranque' in sys.argv[1:]:
+        # python main.py --arranque: solo medir el arranque
+        sys.exit(0 if verificar_arranque() else 1)
+
     # Verificar dependencias
     verificar_dependencias()
     
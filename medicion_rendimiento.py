@@ -0,0 +1,623 @@
+"""
+Motor de medición de rendimiento para División en Párrafos
+Calentamiento, repeticiones, GC desactivado y estadísticas por algoritmo y tamaño
+No requiere matplotlib ni numpy
+"""
+
+import gc
+#Desactivar el recolector de basura durante la región medida
+import time
+#Reloj de alta resolución (perf_counter)
+import math
+import platform
+#Descripción del entorno guardada junto a los resultados
+import statistics
+import json
+from datetime import datetime, timezone
+from operator import methodcaller
+#Algoritmos como llamadas a métodos que se pueden enviar a otros procesos
+from typing import List, Tuple, Dict, Optional, Callable
+import random
+import sys
+import os
+
+from division_parrafos import DivisionParrafos, medir_memoria
+
+
+VERSION_ESQUEMA = 1
+# Versión del formato JSON de resultados (la versión 0 es la lista sin metadatos)
+
+UMBRAL_INESTABLE = 0.10
+# Dispersión (rango intercuartílico / mediana) a partir de la cual una medición se marca inestable
+
+FACTOR_ATIPICO = 1.5
+# Muestras fuera de [Q1 - k·IQR, Q3 + k·IQR] se marcan como atípicas (criterio de Tukey)
+
+EXPONENTES_TEORICOS = {
+    'Iterativo': 2.0,
+    'Divide y Vencerás': 1.0,
+    'Recursivo Memo': 1.0,
+}
+# Exponente k de tiempo ≈ c·n^k que declara el informe (con W fijo); los exponenciales no tienen
+
+TOLERANCIA_EXPONENTE = 0.3
+# Cuánto puede superar el extremo inferior del IC95 del exponente al de la base o al teórico antes de contar como regresión
+
+TOLERANCIA_TIEMPO = 1.5
+# Cuántas veces puede superar el tiempo mínimo medido al de la base antes de contar como regresión
+
+ALGORITMOS = {
+    'Iterativo': (methodcaller('resolver_iterativo'), None),
+    'Divide y Vencerás': (methodcaller('resolver_divide_venceras'), None),
+    'Recursivo': (methodcaller('resolver_recursivo'), 8),
+    'Recursivo Memo': (methodcaller('resolver_recursivo', memo=True, poda=True), None),
+    'Exhaustivo': (methodcaller('resolver_exhaustivo'), 5),
+}
+# nombre -> (función que resuelve un DivisionParrafos, n máximo o None si no tiene límite)
+
+RUTA_STRESS = 'resultados_benchmark_stress.json'
+# Checkpoint y resultados del stress test
+
+TAMAÑOS_STRESS = list(range(500, 3501, 500))
+# Números de palabras del stress test por defecto
+
+ALGORITMOS_STRESS = {
+    'Iterativo': methodcaller('resolver_iterativo'),
+    'Iterativo Acotado': methodcaller('resolver_iterativo', acotado=True),
+    'NumPy': methodcaller('resolver_numpy'),
+    'Divide y Vencerás': methodcaller('resolver_divide_venceras'),
+}
+# Los mismos que el stress test del menú; con incluir_lentos se agregan ALGORITMOS_LENTOS
+
+ALGORITMOS_LENTOS = {
+    'Recursivo': methodcaller('resolver_recursivo'),
+    'Exhaustivo': methodcaller('resolver_exhaustivo'),
+}
+# Algoritmos exponenciales: solo con incluir_lentos, y se detienen por tiempo_limite
+
+
+def medir(funcion: Callable[[], object], repeticiones: int = 10, calentamiento: int = 2,
+          tiempo_minimo: float = 0.002, desactivar_gc: bool = True) -> Dict:
+    """
+    Mide una función sin argumentos.
+
+    Primero se ejecuta calentamiento veces sin medir. Luego se toman
+    repeticiones muestras; cada muestra repite la función las veces
+    necesarias para durar al menos tiempo_minimo (como timeit.autorange),
+    así la resolución del reloj no domina con entradas pequeñas. Antes de
+    cada muestra se recolecta la basura y, con desactivar_gc, el recolector
+    queda apagado durante la región medida.
+
+    Returns:
+        Estadísticas de resumir_muestras (en segundos por llamada) más
+        'llamadas_por_muestra' y 'resultado' (el valor de la última llamada)
+    """
+    resultado = None
+    for _ in range(calentamiento):
+        resultado = funcion()
+
+    # Calibración: llamadas por muestra hasta superar tiempo_minimo
+    llamadas = 1
+    while True:
+        duracion, resultado = _muestra(funcion, llamadas, desactivar_gc)
+        if duracion >= tiempo_minimo or llamadas >= 1 << 20:
+            break
+        llamadas *= 2 if duracion <= 0 else max(2, min(10, math.ceil(tiempo_minimo / duracion)))
+
+    muestras = []
+    for _ in range(repeticiones):
+        duracion, resultado = _muestra(funcion, llamadas, desactivar_gc)
+        muestras.append(duracion / llamadas)
+
+    medicion = resumir_muestras(muestras)
+    medicion['llamadas_por_muestra'] = llamadas
+    medicion['resultado'] = resultado
+    return medicion
+
+
+def _muestra(funcion: Callable[[], object], llamadas: int, desactivar_gc: bool) -> Tuple[float, object]:
+    """Duración total de llamadas ejecuciones seguidas y el último resultado"""
+    gc.collect()
+    activo = gc.isenabled()
+    if desactivar_gc:
+        gc.disable()
+    try:
+        inicio = time.perf_counter()
+        for _ in range(llamadas):
+            resultado = funcion()
+        duracion = time.perf_counter() - inicio
+    finally:
+        if activo:
+            gc.enable()
+    return duracion, resultado
+
+
+def resumir_muestras(muestras: List[float]) -> Dict:
+    """
+    Estadísticas de una lista de tiempos.
+
+    Returns:
+        Diccionario con tiempo (la mediana, igual que el campo de los
+        resultados antiguos), min, mediana, p95, media, desviacion,
+        muestras, atipicos (índices fuera de las cercas de Tukey) e
+        inestable (dispersión intercuartílica mayor que UMBRAL_INESTABLE o
+        más de un 10% de muestras atípicas)
+    """
+    ordenadas = sorted(muestras)
+    mediana = percentil(ordenadas, 50)
+    q1 = percentil(ordenadas, 25)
+    q3 = percentil(ordenadas, 75)
+    iqr = q3 - q1
+    bajo = q1 - FACTOR_ATIPICO * iqr
+    alto = q3 + FACTOR_ATIPICO * iqr
+    atipicos = [i for i, m in enumerate(muestras) if m < bajo or m > alto]
+    dispersion = iqr / mediana if mediana > 0 else 0.0
+
+    return {
+        'tiempo': mediana,
+        'min': ordenadas[0],
+        'mediana': mediana,
+        'p95': percentil(ordenadas, 95),
+        'media': statistics.fmean(ordenadas),
+        'desviacion': statistics.stdev(ordenadas) if len(ordenadas) > 1 else 0.0,
+        'dispersion': dispersion,
+        'muestras': list(muestras),
+        'atipicos': atipicos,
+        'inestable': dispersion > UMBRAL_INESTABLE or len(atipicos) > 0.1 * len(muestras),
+    }
+
+
+def percentil(ordenadas: List[float], q: float) -> float:
+    """Percentil q (0-100) de una lista ordenada, con interpolación lineal"""
+    if not ordenadas:
+        raise ValueError("No hay muestras")
+    posicion = (len(ordenadas) - 1) * q / 100
+    i = math.floor(posicion)
+    j = min(i + 1, len(ordenadas) - 1)
+    return ordenadas[i] + (ordenadas[j] - ordenadas[i]) * (posicion - i)
+
+
+def generar_palabras(n: int, semilla: int = 42, minimo: int = 2, maximo: int = 7) -> List[int]:
+    """Longitudes reproducibles entre minimo y maximo para un tamaño n"""
+    generador = random.Random(semilla + n)
+    return [generador.randint(minimo, maximo) for _ in range(n)]
+
+
+def ejecutar_benchmark(tamaños: List[int], L: int = 20, b: float = 2.0,
+                       algoritmos: Optional[Dict[str, Tuple[Callable, Optional[int]]]] = None,
+                       repeticiones: int = 10, calentamiento: int = 2, tiempo_minimo: float = 0.002,
+                       desactivar_gc: bool = True, semilla: int = 42,
+                       generar: Callable[[int, int], List[int]] = generar_palabras,
+                       informar: Optional[Callable[[str], None]] = print,
+                       memoria: bool = False, sitios_memoria: int = 5) -> Dict:
+    """
+    Mide cada algoritmo en cada tamaño con medir().
+
+    Args:
+        tamaños: Números de palabras a probar
+        L: Longitud de línea
+        b: Amplitud ideal de espacios
+        algoritmos: nombre -> (función(dp), n máximo); por defecto ALGORITMOS
+        repeticiones, calentamiento, tiempo_minimo, desactivar_gc: ver medir
+        semilla: Semilla de generar
+        generar: Función (n, semilla) -> longitudes de palabras
+        informar: Función que recibe los mensajes de progreso (None: silencio)
+        memoria: Si es True, después de medir el tiempo ejecuta una vez más
+            cada algoritmo con medir_memoria y guarda el resultado en 'memoria'
+        sitios_memoria: Líneas con más memoria asignada que se guardan
+
+    Returns:
+        Documento de resultados (ver documento_resultados)
+    """
+    if algoritmos is None:
+        algoritmos = ALGORITMOS
+    informar = informar or (lambda mensaje: None)
+    configuracion = {
+        'L': L, 'b': b, 'semilla': semilla, 'repeticiones': repeticiones,
+        'calentamiento': calentamiento, 'tiempo_minimo': tiempo_minimo,
+        'gc_desactivado': desactivar_gc, 'memoria': memoria,
+    }
+
+    resultados = []
+    for n in tamaños:
+        informar(f"\nProbando con n={n} palabras...")
+        dp = DivisionParrafos(generar(n, semilla), L, b)
+        resultado = {'n': n, 'algoritmos': {}}
+        for nombre, (funcion, n_maximo) in algoritmos.items():
+            if n_maximo is not None and n > n_maximo:
+                informar(f"    {nombre} omitido (n demasiado grande)")
+                continue
+            medicion = medir(lambda: funcion(dp), repeticiones, calentamiento, tiempo_minimo, desactivar_gc)
+            medicion['costo'], _ = medicion.pop('resultado')
+            pico = ""
+            if memoria:
+                medicion['memoria'] = medir_memoria(lambda: funcion(dp), sitios_memoria)[1]
+                pico = f", pico {medicion['memoria']['pico'] / 1024:.1f} KiB"
+            resultado['algoritmos'][nombre] = medicion
+            aviso = " ⚠ inestable" if medicion['inestable'] else ""
+            informar(f"    {nombre:<20} mediana {medicion['mediana'] * 1000:.4f} ms, "
+                     f"min {medicion['min'] * 1000:.4f} ms, p95 {medicion['p95'] * 1000:.4f} ms{pico}{aviso}")
+        resultados.append(resultado)
+
+    return documento_resultados(resultados, configuracion)
+
+
+def documento_resultados(resultados: List[Dict], configuracion: Optional[Dict] = None) -> Dict:
+    """Envuelve una lista de resultados por tamaño en el formato versionado"""
+    return {
+        'version': VERSION_ESQUEMA,
+        'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'entorno': {
+            'python': platform.python_version(),
+            'implementacion': platform.python_implementation(),
+            'plataforma': platform.platform(),
+            'procesador': platform.processor() or platform.machine(),
+        },
+        'configuracion': configuracion or {},
+        'resultados': resultados,
+    }
+
+
+def guardar_resultados(documento: Dict, ruta: str):
+    """Escribe un documento de resultados en JSON"""
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(documento, archivo, indent=2, ensure_ascii=False)
+
+
+def cargar_resultados(ruta: str) -> Dict:
+    """
+    Lee un documento de resultados. Los archivos de la versión 0 (una lista
+    de {'n', 'algoritmos'} con un solo tiempo por algoritmo) se devuelven
+    envueltos en el formato actual con 'version': 0.
+    """
+    with open(ruta, encoding='utf-8') as archivo:
+        datos = json.load(archivo)
+    if isinstance(datos, list):
+        return {'version': 0, 'fecha': None, 'entorno': {}, 'configuracion': {}, 'resultados': datos}
+    if datos.get('version', 0) > VERSION_ESQUEMA:
+        raise ValueError(f"{ruta} usa la versión {datos['version']} del formato; "
+                         f"esta versión solo lee hasta la {VERSION_ESQUEMA}")
+    return datos
+
+
+# ===================== AJUSTE DE COMPLEJIDAD Y CONTROL DE REGRESIONES =====================
+_CUANTILES_T = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+                8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 30: 2.042}
+# Cuantil 0.975 de la t de Student por grados de libertad (más de 30: normal)
+
+
+def _cuantil_t(grados: int) -> float:
+    """Cuantil 0.975 de la t de Student; entre dos filas de la tabla se toma la más conservadora"""
+    if grados > 30:
+        return 1.960
+    return _CUANTILES_T[max(g for g in _CUANTILES_T if g <= grados)]
+
+
+def ajustar_potencia(ns: List[int], tiempos: List[float]) -> Dict:
+    """
+    Ajusta tiempo ≈ c·n^k por mínimos cuadrados sobre log(tiempo) = log(c) + k·log(n).
+
+    Returns:
+        Diccionario con exponente, constante, ic95 (intervalo de confianza
+        del 95% del exponente, con la t de Student), r2 y puntos
+    """
+    puntos = [(math.log(n), math.log(t)) for n, t in zip(ns, tiempos) if n > 0 and t > 0]
+    if len(puntos) < 3 or len({x for x, _ in puntos}) < 2:
+        raise ValueError("Se necesitan al menos 3 tamaños distintos con tiempo positivo")
+
+    m = len(puntos)
+    media_x = statistics.fmean(x for x, _ in puntos)
+    media_y = statistics.fmean(y for _, y in puntos)
+    sxx = sum((x - media_x) ** 2 for x, _ in puntos)
+    sxy = sum((x - media_x) * (y - media_y) for x, y in puntos)
+    exponente = sxy / sxx
+    intercepto = media_y - exponente * media_x
+
+    residuos = sum((y - intercepto - exponente * x) ** 2 for x, y in puntos)
+    total = sum((y - media_y) ** 2 for _, y in puntos)
+    error = math.sqrt(residuos / (m - 2) / sxx)
+    margen = _cuantil_t(m - 2) * error
+
+    return {
+        'exponente': exponente,
+        'constante': math.exp(intercepto),
+        'ic95': [exponente - margen, exponente + margen],
+        'r2': 1 - residuos / total if total > 0 else 1.0,
+        'puntos': m,
+    }
+
+
+def ajustar_complejidades(documento: Dict) -> Dict[str, Dict]:
+    """Ajuste de potencia de cada algoritmo medido en al menos 3 tamaños (con la mediana)"""
+    series: Dict[str, Tuple[List[int], List[float]]] = {}
+    for resultado in documento['resultados']:
+        for nombre, datos in resultado['algoritmos'].items():
+            ns, tiempos = series.setdefault(nombre, ([], []))
+            ns.append(resultado['n'])
+            tiempos.append(datos.get('mediana', datos['tiempo']))
+
+    ajustes = {}
+    for nombre, (ns, tiempos) in series.items():
+        try:
+            ajustes[nombre] = ajustar_potencia(ns, tiempos)
+        except ValueError:
+            continue
+    return ajustes
+
+
+def comparar_con_base(documento: Dict, base: Optional[Dict] = None,
+                      tolerancia_exponente: float = TOLERANCIA_EXPONENTE,
+                      tolerancia_tiempo: float = TOLERANCIA_TIEMPO) -> List[str]:
+    """
+    Busca regresiones de rendimiento.
+
+    Hay regresión si todo el intervalo de confianza del 95% del exponente
+    ajustado de un algoritmo supera en más de tolerancia_exponente al de la
+    base o al de EXPONENTES_TEORICOS (un exponente puntual por encima del
+    umbral con un intervalo que lo incluye es ruido de medición), o si en
+    algún tamaño medido en ambos su tiempo mínimo supera tolerancia_tiempo
+    veces al de la base.
+
+    Returns:
+        Lista de descripciones de las regresiones (vacía si no hay)
+    """
+    regresiones = []
+    ajustes = ajustar_complejidades(documento)
+    ajustes_base = ajustar_complejidades(base) if base else {}
+
+    for nombre, ajuste in sorted(ajustes.items()):
+        k = ajuste['exponente']
+        bajo, alto = ajuste['ic95']
+        referencias = []
+        if nombre in EXPONENTES_TEORICOS:
+            referencias.append(('teórico', EXPONENTES_TEORICOS[nombre]))
+        if nombre in ajustes_base:
+            referencias.append(('de la base', ajustes_base[nombre]['exponente']))
+        for origen, esperado in referencias:
+            if bajo > esperado + tolerancia_exponente:
+                regresiones.append(f"{nombre}: exponente {k:.2f} (IC95 {bajo:.2f}-{alto:.2f}) "
+                                   f"supera el {origen} {esperado:.2f}")
+
+    if base:
+        tiempos_base = {(r['n'], nombre): datos.get('min', datos['tiempo'])
+                        for r in base['resultados'] for nombre, datos in r['algoritmos'].items()}
+        for resultado in documento['resultados']:
+            for nombre, datos in sorted(resultado['algoritmos'].items()):
+                anterior = tiempos_base.get((resultado['n'], nombre))
+                actual = datos.get('min', datos['tiempo'])
+                if anterior and actual > tolerancia_tiempo * anterior:
+                    regresiones.append(f"{nombre} n={resultado['n']}: {actual * 1000:.4f} ms, "
+                                       f"{actual / anterior:.2f} veces la base ({anterior * 1000:.4f} ms)")
+    return regresiones
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Benchmark con ajuste de complejidad y control de regresiones:
+
+        python medicion_rendimiento.py --base base.json [--guardar nuevo.json]
+
+    Termina con código 1 si comparar_con_base encuentra regresiones. Con
+    --stress ejecuta en cambio ejecutar_stress (sin preguntas, reanudable).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Mide los algoritmos, ajusta tiempo ≈ c·n^k y compara con una base.')
+    parser.add_argument('--tamaños', type=int, nargs='+', default=None,
+                        help='números de palabras a medir (25 50 100 200 400; con --stress, '
+                             'de 500 a 3500 de 500 en 500)')
+    parser.add_argument('--L', type=int, default=None, help='longitud de línea (20; con --stress, 60)')
+    parser.add_argument('--b', type=float, default=None, help='amplitud ideal de espacios (2.0; con --stress, 1.5)')
+    parser.add_argument('--repeticiones', type=int, default=None, help='muestras por medición (10; con --stress, 3)')
+    parser.add_argument('--calentamiento', type=int, default=2)
+    parser.add_argument('--memoria', action='store_true',
+                        help='mide también el pico de memoria con tracemalloc (no en el stress test)')
+    parser.add_argument('--stress', action='store_true',
+                        help='stress test con entradas grandes en un pool de procesos')
+    parser.add_argument('--jobs', type=int, default=None, help='procesos del stress test (por defecto, los núcleos)')
+    parser.add_argument('--tiempo-limite', type=float, default=60.0,
+                        help='segundos por algoritmo y tamaño en el stress test (60)')
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--lentos', action='store_true',
+                        help='incluye Recursivo y Exhaustivo en el stress test')
+    parser.add_argument('--salida', default=RUTA_STRESS,
+                        help=f'checkpoint y resultados del stress test ({RUTA_STRESS})')
+    parser.add_argument('--base', help='JSON de resultados con el que comparar')
+    parser.add_argument('--guardar', help='guarda los resultados (por ejemplo, para usarlos como base)')
+    parser.add_argument('--tolerancia-exponente', type=float, default=TOLERANCIA_EXPONENTE)
+    parser.add_argument('--tolerancia-tiempo', type=float, default=TOLERANCIA_TIEMPO)
+    args = parser.parse_args(argv)
+
+    if args.stress:
+        ejecutar_stress(args.tamaños or TAMAÑOS_STRESS, args.L or 60, args.b or 1.5,
+                        semilla=args.semilla, workers=args.jobs, tiempo_limite=args.tiempo_limite,
+                        repeticiones=args.repeticiones or 3, ruta=args.salida, incluir_lentos=args.lentos)
+        return 0
+    args.tamaños = args.tamaños or [25, 50, 100, 200, 400]
+    args.L = args.L or 20
+    args.b = args.b or 2.0
+    args.repeticiones = args.repeticiones or 10
+
+    # Los algoritmos exponenciales no tienen exponente polinomial que ajustar
+    algoritmos = {nombre: (funcion, n_maximo) for nombre, (funcion, n_maximo) in ALGORITMOS.items()
+                  if n_maximo is None}
+    documento = ejecutar_benchmark(args.tamaños, args.L, args.b, algoritmos, args.repeticiones,
+                                   args.calentamiento, memoria=args.memoria)
+    documento['ajustes'] = ajustar_complejidades(documento)
+    if args.guardar:
+        guardar_resultados(documento, args.guardar)
+
+    print(f"\n{'Algoritmo':<20} | {'k':>6} | {'IC95':>13} | {'R²':>6} | {'Teórico':>7}")
+    print("-" * 64)
+    for nombre, ajuste in documento['ajustes'].items():
+        bajo, alto = ajuste['ic95']
+        teorico = EXPONENTES_TEORICOS.get(nombre)
+        print(f"{nombre:<20} | {ajuste['exponente']:>6.2f} | {bajo:>5.2f} - {alto:<5.2f} | "
+              f"{ajuste['r2']:>6.3f} | {teorico if teorico is not None else '-':>7}")
+
+    base = cargar_resultados(args.base) if args.base else None
+    regresiones = comparar_con_base(documento, base, args.tolerancia_exponente, args.tolerancia_tiempo)
+    if regresiones:
+        print("\n❌ REGRESIONES:")
+        for regresion in regresiones:
+            print(f"  - {regresion}")
+        return 1
+    print("\n✅ Sin regresiones" + (f" respecto a {args.base}" if args.base else ""))
+    return 0
+
+
+# ===================== STRESS TEST CON ENTRADAS GRANDES =====================
+def ejecutar_stress(tamaños: List[int] = TAMAÑOS_STRESS, L: int = 60, b: float = 1.5, semilla: int = 42,
+                    workers: Optional[int] = None, tiempo_limite: float = 60.0, repeticiones: int = 3,
+                    ruta: Optional[str] = RUTA_STRESS, incluir_lentos: bool = False,
+                    informar: Optional[Callable[[str], None]] = print) -> Dict:
+    """
+    Stress test sin interacción: cada par (algoritmo, n) se mide en su
+    propio proceso, con hasta workers procesos a la vez.
+
+    Las longitudes (entre 2 y 10) salen de generar_palabras con la semilla,
+    así que cada ejecución es reproducible. Un proceso que supera
+    tiempo_limite se termina y el algoritmo ya no se intenta con tamaños
+    mayores. Tras cada medición el documento se escribe en ruta; si ruta ya
+    tiene resultados de la misma configuración, solo se ejecuta lo que
+    falta, así que una ejecución interrumpida se puede reanudar.
+
+    Los procesos compiten por los núcleos: con workers > 1 los tiempos
+    absolutos son algo mayores que midiendo de a uno.
+
+    Returns:
+        Documento de resultados; cada tamaño lleva además 'omitidos'
+        (algoritmo -> motivo: tiempo límite, error o límite de un tamaño menor)
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    informar = informar or (lambda mensaje: None)
+    algoritmos = dict(ALGORITMOS_STRESS, **(ALGORITMOS_LENTOS if incluir_lentos else {}))
+    configuracion = {
+        'tipo': 'stress', 'L': L, 'b': b, 'semilla': semilla, 'tiempo_limite': tiempo_limite,
+        'repeticiones': repeticiones, 'algoritmos': list(algoritmos),
+    }
+
+    documento = _reanudar_stress(ruta, configuracion, informar)
+    por_n = {r['n']: r for r in documento['resultados']}
+    for n in sorted(set(tamaños)):
+        por_n.setdefault(n, {'n': n, 'algoritmos': {}, 'omitidos': {}})
+    documento['resultados'] = [por_n[n] for n in sorted(por_n)]
+
+    # Menor tamaño en el que cada algoritmo agotó el tiempo
+    agotados = {}
+    for resultado in documento['resultados']:
+        for nombre, motivo in resultado.get('omitidos', {}).items():
+            if motivo == 'tiempo límite':
+                agotados[nombre] = min(agotados.get(nombre, resultado['n']), resultado['n'])
+
+    pendientes = [(n, nombre) for n in sorted(set(tamaños)) for nombre in algoritmos
+                  if nombre not in por_n[n]['algoritmos'] and nombre not in por_n[n].get('omitidos', {})]
+    if not pendientes:
+        informar("Nada pendiente: los resultados ya están completos")
+        return documento
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pendientes)))
+    informar(f"Stress test: {len(pendientes)} mediciones en {workers} procesos "
+             f"(límite {tiempo_limite:g} s por medición)")
+
+    en_curso = {}
+    try:
+        while pendientes or en_curso:
+            while pendientes and len(en_curso) < workers:
+                n, nombre = pendientes.pop(0)
+                if nombre in agotados and n > agotados[nombre]:
+                    _registrar_stress(por_n[n], nombre, None, f"tiempo límite con n={agotados[nombre]}",
+                                      documento, ruta, informar)
+                    continue
+                receptor, emisor = multiprocessing.Pipe(duplex=False)
+                proceso = multiprocessing.Process(target=_tarea_stress,
+                                                  args=(emisor, nombre, n, L, b, semilla, repeticiones,
+                                                        incluir_lentos),
+                                                  daemon=True)
+                proceso.start()
+                emisor.close()
+                en_curso[receptor] = (proceso, n, nombre, time.perf_counter())
+
+            if not en_curso:
+                continue
+            vence = min(inicio for _, _, _, inicio in en_curso.values()) + tiempo_limite
+            for receptor in wait(list(en_curso), timeout=max(0.0, vence - time.perf_counter())):
+                proceso, n, nombre, _ = en_curso.pop(receptor)
+                try:
+                    estado, valor = receptor.recv()
+                except EOFError:
+                    estado, valor = 'error', f"el proceso terminó con código {proceso.exitcode}"
+                receptor.close()
+                proceso.join()
+                _registrar_stress(por_n[n], nombre, valor if estado == 'ok' else None,
+                                  None if estado == 'ok' else valor, documento, ruta, informar)
+
+            ahora = time.perf_counter()
+            for receptor, (proceso, n, nombre, inicio) in list(en_curso.items()):
+                if ahora - inicio >= tiempo_limite:
+                    proceso.terminate()
+                    proceso.join()
+                    receptor.close()
+                    del en_curso[receptor]
+                    agotados[nombre] = min(agotados.get(nombre, n), n)
+                    _registrar_stress(por_n[n], nombre, None, 'tiempo límite', documento, ruta, informar)
+    finally:
+        for proceso, _, _, _ in en_curso.values():
+            proceso.terminate()
+
+    informar("\nStress test finalizado.")
+    return documento
+
+
+def _tarea_stress(conexion, nombre: str, n: int, L: int, b: float, semilla: int, repeticiones: int,
+                  incluir_lentos: bool):
+    """Mide un algoritmo con un tamaño y envía ('ok', medición) o ('error', mensaje) (otro proceso)"""
+    try:
+        algoritmos = dict(ALGORITMOS_STRESS, **(ALGORITMOS_LENTOS if incluir_lentos else {}))
+        dp = DivisionParrafos(generar_palabras(n, semilla, 2, 10), L, b)
+        funcion = algoritmos[nombre]
+        medicion = medir(lambda: funcion(dp), repeticiones, calentamiento=0, tiempo_minimo=0)
+        medicion['costo'], _ = medicion.pop('resultado')
+        conexion.send(('ok', medicion))
+    except Exception as e:
+        conexion.send(('error', f"{type(e).__name__}: {e}"))
+    finally:
+        conexion.close()
+
+
+def _registrar_stress(resultado: Dict, nombre: str, medicion: Optional[Dict], motivo: Optional[str],
+                      documento: Dict, ruta: Optional[str], informar: Callable[[str], None]):
+    """Guarda una medición (o el motivo por el que falta) y escribe el checkpoint"""
+    n = resultado['n']
+    if medicion is not None:
+        resultado['algoritmos'][nombre] = medicion
+        informar(f"  n={n:<6} {nombre:<20} mediana {medicion['mediana'] * 1000:10.4f} ms | "
+                 f"costo {medicion['costo']:.4f}")
+    else:
+        resultado.setdefault('omitidos', {})[nombre] = motivo
+        informar(f"  n={n:<6} {nombre:<20} omitido: {motivo}")
+    if ruta:
+        # Escritura atómica: un proceso interrumpido no deja el JSON a medias
+        temporal = ruta + '.tmp'
+        guardar_resultados(documento, temporal)
+        os.replace(temporal, ruta)
+
+
+def _reanudar_stress(ruta: Optional[str], configuracion: Dict, informar: Callable[[str], None]) -> Dict:
+    """Documento guardado en ruta si tiene la misma configuración; si no, uno vacío"""
+    if ruta and os.path.exists(ruta):
+        try:
+            anterior = cargar_resultados(ruta)
+        except ValueError:
+            anterior = None
+        if anterior and anterior.get('configuracion') == configuracion:
+            informar(f"Reanudando desde {ruta}")
+            return anterior
+        informar(f"{ruta} tiene otra configuración: se empieza de cero")
+    return documento_resultados([], configuracion)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,10 @@ Ejecutar con: pytest test_division_parrafos.py -v
 
 import pytest
 import math
-from division_parrafos import DivisionParrafos, ejecutar_y_medir
+from division_parrafos import (DivisionParrafos, StreamingDivisionParrafos, ejecutar_y_medir, resolver_lote,
+                               cargar_longitudes, generar_longitudes, iterar_longitudes,
+                               ModeloCuadratico, ModeloKnuthPlass, ModeloIrregularidad, ModeloCubico,
+                               ancho_visual, formatear_documento, main)
 
 
 class TestCalculoCosto:
@@ -49,6 +52,163 @@ class TestCalculoCosto:
         assert costo == float('inf')
 
 
+class TestLongitudesAcumuladas:
+    """Tests para el índice de longitudes acumuladas (sumas de prefijos)"""
+
+    def test_prefijos_construidos(self):
+        """El índice se construye en el constructor"""
+        dp = DivisionParrafos([5, 3, 4], 15, 1.5)
+        assert dp.prefijos == [0, 5, 8, 12]
+
+    def test_reasignar_palabras_reconstruye(self):
+        """Asignar nuevas palabras reconstruye el índice y k"""
+        dp = DivisionParrafos([5, 3, 4], 15, 1.5)
+        dp.palabras = [2, 2]
+        assert dp.k == 2
+        assert dp.prefijos == [0, 2, 4]
+        # Ahora (0, 1) es la última línea: sobrante = 15 - 5 = 10
+        assert dp.calcular_costo_linea(0, 1) == pytest.approx((10 / 15) ** 2)
+
+    def test_costos_iguales_a_suma_directa(self):
+        """El costo con prefijos coincide con sumar las longitudes"""
+        palabras = [3, 4, 2, 5, 3, 4, 6, 2]
+        dp = DivisionParrafos(palabras, 20, 2.0)
+        for i in range(len(palabras)):
+            for j in range(i, len(palabras)):
+                espacio = sum(palabras[i:j+1]) + (j - i)
+                costo = dp.calcular_costo_linea(i, j)
+                assert (costo == float('inf')) == (espacio > 20)
+
+
+class TestAlmacenamientoCompacto:
+    """Tests para el modo compacto (arreglos en vez de listas)"""
+
+    def test_tipos_de_arreglo(self):
+        """Longitudes en array('H') y acumuladas en array('I')"""
+        dp = DivisionParrafos([3, 4, 2], 15, 1.5, compacto=True)
+        assert dp.palabras.typecode == 'H'
+        assert dp.prefijos.typecode == 'I'
+        assert list(dp.prefijos) == [0, 3, 7, 9]
+
+    def test_mismo_resultado_que_listas(self):
+        """El modo compacto no cambia la solución"""
+        palabras = [3, 7, 2, 9, 5, 4, 10, 6] * 30
+        normal = DivisionParrafos(palabras, 25, 1.5)
+        compacto = DivisionParrafos(palabras, 25, 1.5, compacto=True)
+        assert compacto.resolver_iterativo() == normal.resolver_iterativo()
+        assert (compacto.resolver_iterativo(acotado=True)
+                == normal.resolver_iterativo(acotado=True))
+        assert compacto.resolver_divide_venceras() == normal.resolver_divide_venceras()
+
+    def test_arreglo_numpy_sin_copia(self):
+        """Un arreglo NumPy uint16 se usa tal cual"""
+        np = pytest.importorskip("numpy")
+        longitudes = np.array([3, 7, 2, 9, 5, 4, 10, 6] * 30, dtype=np.uint16)
+        dp = DivisionParrafos(longitudes, 25, 1.5, compacto=True)
+        assert dp.palabras is longitudes
+        normal = DivisionParrafos(longitudes.tolist(), 25, 1.5)
+        assert (dp.resolver_iterativo(acotado=True)
+                == normal.resolver_iterativo(acotado=True))
+        assert dp.resolver_numpy() == normal.resolver_numpy()
+
+    def test_longitud_fuera_de_rango(self):
+        """Longitudes mayores que 65535 no caben en 16 bits"""
+        with pytest.raises(ValueError):
+            DivisionParrafos([3, 70000], 15, 1.5, compacto=True)
+
+    def test_sin_diccionario_de_instancia(self):
+        """La clase declara __slots__"""
+        dp = DivisionParrafos([3, 4], 15, 1.5)
+        assert not hasattr(dp, '__dict__')
+
+
+class TestCargaLongitudes:
+    """Tests para la carga de longitudes desde archivo"""
+
+    def test_archivo_de_texto(self, tmp_path):
+        """Genera el archivo auxiliar y lo abre como vista"""
+        texto = tmp_path / "texto.txt"
+        texto.write_text("el rápido zorro\nmarrón  salta\n", encoding="utf-8")
+        longitudes = cargar_longitudes(str(texto), texto=True)
+        assert list(iterar_longitudes(longitudes)) == [2, 6, 5, 6, 5]
+        assert (tmp_path / "texto.txt.longitudes").stat().st_size == 10
+
+    def test_palabras_entre_bloques(self, tmp_path):
+        """Una palabra partida entre dos bloques de lectura se cuenta una vez"""
+        texto = tmp_path / "texto.txt"
+        texto.write_text("casa perro gato elefante", encoding="utf-8")
+        ruta = generar_longitudes(str(texto), tam_bloque=3)
+        assert list(iterar_longitudes(cargar_longitudes(ruta))) == [4, 5, 4, 8]
+
+    def test_resolver_desde_archivo(self, tmp_path):
+        """La vista se resuelve igual que la lista de longitudes"""
+        palabras = [3, 7, 2, 9, 5, 4, 10, 6] * 30
+        ruta = tmp_path / "longitudes.bin"
+        ruta.write_bytes(b"".join(l.to_bytes(2, "little") for l in palabras))
+        dp = DivisionParrafos(cargar_longitudes(str(ruta)), 25, 1.5, compacto=True)
+        normal = DivisionParrafos(palabras, 25, 1.5)
+        assert (dp.resolver_iterativo(acotado=True)
+                == normal.resolver_iterativo(acotado=True))
+
+    def test_resolver_desde_archivo_sin_compacto(self, tmp_path):
+        """Sin compacto, las longitudes acumuladas de la vista no desbordan 16 bits"""
+        palabras = [3, 7, 2, 9, 5, 4, 10, 6] * 2000
+        ruta = tmp_path / "longitudes.bin"
+        ruta.write_bytes(b"".join(l.to_bytes(2, "little") for l in palabras))
+        dp = DivisionParrafos(cargar_longitudes(str(ruta)), 25, 1.5)
+        assert dp.prefijos[-1] == sum(palabras) > 65535
+        normal = DivisionParrafos(palabras, 25, 1.5)
+        esperado = normal.resolver_iterativo(acotado=True)
+        assert dp.resolver_iterativo(acotado=True) == esperado
+        assert dp.resolver_divide_venceras()[0] == pytest.approx(esperado[0])
+
+    def test_archivo_vacio(self, tmp_path):
+        """Un archivo vacío es un párrafo sin palabras"""
+        ruta = tmp_path / "vacio.bin"
+        ruta.write_bytes(b"")
+        dp = DivisionParrafos(cargar_longitudes(str(ruta)), 15, 1.5, compacto=True)
+        assert dp.k == 0
+
+
+class TestCacheCostos:
+    """Tests para el caché LRU de costos de línea"""
+
+    def test_desactivado_por_defecto(self):
+        """Sin tam_cache no hay caché"""
+        dp = DivisionParrafos([3, 4, 2], 15, 1.5)
+        assert dp.estadisticas_cache() == {}
+
+    def test_aciertos_entre_resoluciones(self):
+        """La segunda resolución reutiliza los costos de la primera"""
+        dp = DivisionParrafos([3, 7, 2, 9, 5, 4, 10, 6] * 3, 25, 1.5, tam_cache=1000)
+        esperado = DivisionParrafos(dp.palabras, 25, 1.5).resolver_iterativo()
+        assert dp.resolver_iterativo() == esperado
+        fallos = dp.estadisticas_cache()['fallos']
+        assert dp.resolver_iterativo() == esperado
+        estadisticas = dp.estadisticas_cache()
+        assert estadisticas['fallos'] == fallos
+        assert estadisticas['aciertos'] >= fallos
+
+    def test_capacidad_acotada(self):
+        """El caché nunca supera su capacidad"""
+        dp = DivisionParrafos([3, 7, 2, 9, 5, 4, 10, 6] * 5, 25, 1.5, tam_cache=16)
+        costo, _ = dp.resolver_divide_venceras()
+        assert dp.estadisticas_cache()['tamaño'] <= 16
+        assert costo == DivisionParrafos(dp.palabras, 25, 1.5).resolver_divide_venceras()[0]
+
+    def test_invalidacion(self):
+        """Cambiar L, b o palabras descarta los costos guardados"""
+        dp = DivisionParrafos([5, 3, 4], 15, 1.5, tam_cache=100)
+        anterior = dp.calcular_costo_linea(0, 1)
+        dp.b = 1.0
+        assert dp.estadisticas_cache()['tamaño'] == 0
+        assert dp.calcular_costo_linea(0, 1) != anterior
+        dp.L = 20
+        assert dp.calcular_costo_linea(0, 1) == DivisionParrafos([5, 3, 4], 20, 1.0).calcular_costo_linea(0, 1)
+        dp.palabras = [2, 2]
+        assert dp.calcular_costo_linea(0, 1) == pytest.approx((15 / 20) ** 2)
+
+
 class TestAlgoritmoIterativo:
     """Tests para el algoritmo iterativo (DP)"""
     
@@ -90,6 +250,831 @@ class TestAlgoritmoIterativo:
         assert len(cortes) <= 4
 
 
+class TestIterativoAcotado:
+    """Tests para el modo acotado por ancho de línea del iterativo"""
+
+    @pytest.mark.parametrize("palabras,L,b", [
+        ([5, 3, 4, 6, 2], 15, 1.5),
+        ([3, 4, 2, 5, 3, 4, 6, 2, 3, 5], 20, 2.0),
+        ([5] * 10, 15, 1.0),
+        ([10, 10, 10], 15, 1.0),
+    ])
+    def test_igual_a_iterativo_completo(self, palabras, L, b):
+        """Mismo costo y mismos cortes que el recorrido completo"""
+        dp = DivisionParrafos(palabras, L, b)
+        assert dp.resolver_iterativo(acotado=True) == dp.resolver_iterativo()
+
+    def test_palabra_mas_larga_que_linea(self):
+        """Si una palabra no cabe, no hay solución (igual que el completo)"""
+        dp = DivisionParrafos([3, 20, 3], 15, 1.5)
+        assert dp.resolver_iterativo(acotado=True) == (float('inf'), [])
+
+    def test_entrada_grande(self):
+        """El modo acotado maneja miles de palabras rápidamente"""
+        import time
+        palabras = [3, 7, 2, 9, 5, 4, 10, 6] * 500  # 4000 palabras
+        dp = DivisionParrafos(palabras, 60, 1.5)
+
+        inicio = time.perf_counter()
+        costo, cortes = dp.resolver_iterativo(acotado=True)
+        tiempo = time.perf_counter() - inicio
+
+        assert costo < float('inf')
+        assert tiempo < 1.0
+
+
+class TestAlgoritmoNumpy:
+    """Tests para la DP vectorizada con NumPy"""
+
+    @pytest.mark.parametrize("palabras,L,b", [
+        ([5], 15, 1.5),
+        ([5, 3, 4, 6, 2], 15, 1.5),
+        ([3, 4, 2, 5, 3, 4, 6, 2, 3, 5], 20, 2.0),
+        ([5] * 10, 15, 1.0),
+        ([3, 7, 2, 9, 5, 4, 10, 6] * 100, 60, 1.5),
+    ])
+    def test_igual_a_iterativo(self, palabras, L, b):
+        """Mismo costo (dentro de 1e-9) y mismos cortes que el iterativo"""
+        pytest.importorskip("numpy")
+        dp = DivisionParrafos(palabras, L, b)
+        costo_np, cortes_np = dp.resolver_numpy()
+        costo_iter, cortes_iter = dp.resolver_iterativo()
+        assert costo_np == pytest.approx(costo_iter, abs=1e-9)
+        assert cortes_np == cortes_iter
+
+    def test_bloques_pequenos(self):
+        """El tamaño de bloque no cambia el resultado"""
+        pytest.importorskip("numpy")
+        dp = DivisionParrafos([3, 4, 2, 5, 3, 4, 6, 2, 3, 5], 20, 2.0)
+        assert dp.resolver_numpy(tam_bloque=3) == dp.resolver_numpy()
+
+    def test_sin_solucion(self):
+        pytest.importorskip("numpy")
+        assert DivisionParrafos([20, 20], 15, 1.5).resolver_numpy() == (float('inf'), [])
+        assert DivisionParrafos([], 15, 1.5).resolver_numpy() == (0.0, [])
+
+
+class DivisionIrregularidad(DivisionParrafos):
+    """Costo solo por espacio sobrante (convexo en el ancho de la línea)"""
+
+    def _costo_por_medidas(self, suma_longitudes, num_palabras, ultima):
+        ancho = suma_longitudes + num_palabras - 1
+        if ancho > self.L:
+            return float('inf')
+        if ultima:
+            return 0.0
+        return ((self.L - ancho) / self.L) ** 2
+
+
+class TestMultiL:
+    """Tests para resolver_multi_L"""
+
+    palabras = [3, 7, 2, 9, 5, 4, 10, 6, 1, 8] * 6
+
+    def test_igual_que_cada_ancho(self):
+        """Cada entrada de la tabla es la solución para ese ancho"""
+        dp = DivisionParrafos(self.palabras, 30, 1.5)
+        tabla = dp.resolver_multi_L(range(8, 41))['tabla']
+        assert list(tabla) == list(range(8, 41))
+        for L, (costo, cortes) in tabla.items():
+            esperado = DivisionParrafos(self.palabras, L, 1.5).resolver_iterativo(acotado=True)
+            assert costo == pytest.approx(esperado[0])
+            assert cortes == esperado[1]
+
+    def test_sin_numpy_igual(self):
+        """El camino en Python puro da la misma tabla"""
+        pytest.importorskip("numpy")
+        dp = DivisionParrafos(self.palabras, 30, 1.5)
+        con_numpy = dp.resolver_multi_L([12, 20, 35])['tabla']
+        sin_numpy = dp.resolver_multi_L([35, 20, 12], workers=1)['tabla']
+        for L in con_numpy:
+            assert con_numpy[L][0] == pytest.approx(sin_numpy[L][0])
+            assert con_numpy[L][1] == sin_numpy[L][1]
+
+    def test_cambios(self):
+        """Solo se reportan los anchos donde cambian los cortes"""
+        dp = DivisionParrafos([4, 4, 4], 10, 1.0)
+        resultado = dp.resolver_multi_L(range(3, 20))
+        tabla = resultado['tabla']
+        # Menos de 4 columnas no alcanza para ninguna palabra
+        assert tabla[3] == (float('inf'), [])
+        assert resultado['cambios'][0] == 3
+        for anterior, L in zip(range(3, 19), range(4, 20)):
+            assert (L in resultado['cambios']) == (tabla[L][1] != tabla[anterior][1])
+        # Con 14 columnas caben las tres palabras en una línea
+        assert tabla[14][1] == [] and 14 in resultado['cambios']
+
+    def test_parrafo_vacio(self):
+        """Sin palabras todos los anchos cuestan 0"""
+        resultado = DivisionParrafos([], 10, 1.0).resolver_multi_L([10, 20])
+        assert resultado == {'tabla': {10: (0.0, []), 20: (0.0, [])}, 'cambios': [10]}
+
+
+class TestBarridoB:
+    """Tests para barrido_b"""
+
+    palabras = [3, 7, 2, 9, 5, 4, 10, 6, 1, 8] * 6
+    valores_b = [0.5, 1.0, 1.25, 1.5, 2.0, 3.0]
+
+    def test_igual_que_cada_b(self):
+        """Cada entrada es exactamente la solución para ese b"""
+        dp = DivisionParrafos(self.palabras, 25, 1.5)
+        tabla = dp.barrido_b(self.valores_b)['tabla']
+        for b in self.valores_b:
+            assert tabla[b] == DivisionParrafos(self.palabras, 25, b).resolver_iterativo(acotado=True)
+
+    def test_pools(self):
+        """Con hilos o procesos el resultado no cambia"""
+        dp = DivisionParrafos(self.palabras, 25, 1.5)
+        secuencial = dp.barrido_b(self.valores_b)
+        assert dp.barrido_b(self.valores_b, workers=2, hilos=True) == secuencial
+        assert dp.barrido_b(self.valores_b, workers=2) == secuencial
+
+    def test_cambios(self):
+        """El primer valor siempre cuenta como cambio"""
+        resultado = DivisionParrafos(self.palabras, 25, 1.5).barrido_b(self.valores_b)
+        assert resultado['cambios'][0] == 0.5
+        assert set(resultado['cambios']) <= set(self.valores_b)
+
+    def test_modelo_de_costo_propio(self):
+        """Una subclase con otro costo se resuelve sin la descomposición en b"""
+        dp = DivisionIrregularidad(self.palabras, 25, 1.5)
+        tabla = dp.barrido_b([1.0, 2.0])['tabla']
+        assert tabla[2.0] == DivisionIrregularidad(self.palabras, 25, 2.0).resolver_iterativo(acotado=True)
+
+
+class TestModelosCosto:
+    """Tests para los modelos de costo intercambiables"""
+
+    palabras = [3, 7, 2, 9, 5, 4, 10, 6, 1, 8] * 6
+    modelos = [ModeloCuadratico(), ModeloKnuthPlass(), ModeloIrregularidad(), ModeloCubico()]
+
+    def test_modelo_por_defecto(self):
+        """Sin modelo se usa el cuadrático"""
+        dp = DivisionParrafos([5, 3, 4], 15, 1.5)
+        assert isinstance(dp.modelo, ModeloCuadratico)
+        assert dp.calcular_costo_linea(0, 1) == pytest.approx(30.41, abs=0.01)
+
+    def test_irregularidad_igual_que_subclase(self):
+        """El modelo da lo mismo que redefinir _costo_por_medidas"""
+        dp = DivisionParrafos(self.palabras, 25, 1.5, modelo=ModeloIrregularidad())
+        sub = DivisionIrregularidad(self.palabras, 25, 1.5)
+        assert dp.resolver_iterativo(acotado=True) == sub.resolver_iterativo(acotado=True)
+
+    def test_kernel_numpy_igual_que_python(self):
+        """El kernel vectorizado coincide con el de Python para cada modelo"""
+        np = pytest.importorskip('numpy')
+        suma = np.arange(0, 30)[:, None]
+        num_palabras = np.arange(1, 6)[None, :]
+        for modelo in self.modelos:
+            escalar = modelo.kernel(25, 1.5)
+            vectorial = modelo.kernel_numpy(25, 1.5)
+            for ultima in (False, True):
+                tabla = vectorial(suma, num_palabras, ultima)
+                for s in range(30):
+                    for p in range(1, 6):
+                        assert tabla[s, p - 1] == pytest.approx(escalar(s, p, ultima))
+
+    def test_resolvedores_coinciden(self):
+        """Todos los resolvedores usan el modelo elegido"""
+        import random
+        generador = random.Random(17)
+        palabras = [generador.randint(1, 9) for _ in range(40)]
+        for modelo in self.modelos:
+            dp = DivisionParrafos(palabras, 24, 1.5, modelo=modelo)
+            costo, _ = dp.resolver_iterativo()
+            assert dp.resolver_iterativo(acotado=True)[0] == pytest.approx(costo)
+            assert dp.resolver_numpy()[0] == pytest.approx(costo)
+            assert dp.resolver_recursivo(memo=True)[0] == pytest.approx(costo)
+            assert dp.resolver_divide_venceras()[0] == pytest.approx(costo)
+
+    def test_convexo_lineal_sin_verificar(self):
+        """Con un modelo convexo resolver_lineal da el óptimo de la DP"""
+        import random
+        generador = random.Random(5)
+        palabras = [generador.randint(1, 6) for _ in range(300)]
+        for modelo in (ModeloIrregularidad(), ModeloCubico()):
+            # L ancho: resolver_iterativo(acotado=True) delega en resolver_lineal
+            dp = DivisionParrafos(palabras, 600, 1.5, modelo=modelo)
+            costo = dp._resolver_acotado()[0]
+            assert dp.resolver_lineal()[0] == pytest.approx(costo)
+            assert dp.resolver_iterativo(acotado=True)[0] == pytest.approx(costo)
+
+    def test_cambiar_L_y_b(self):
+        """El kernel se vuelve a preparar al cambiar L o b"""
+        dp = DivisionParrafos([5, 3, 4], 15, 1.5, modelo=ModeloKnuthPlass())
+        antes = dp.calcular_costo_linea(0, 1)
+        dp.b = 3.0
+        assert dp.calcular_costo_linea(0, 1) != antes
+        dp.L = 9
+        assert dp.calcular_costo_linea(0, 1) == ModeloKnuthPlass().kernel(9, 3.0)(8, 2, False)
+
+    def test_cambiar_modelo(self):
+        """Asignar otro modelo cambia el costo, también el de la DP incremental y el caché"""
+        dp = DivisionParrafos(self.palabras, 25, 1.5, tam_cache=64)
+        antes = dp.resolver()[0]
+        dp.calcular_costo_linea(0, 1)
+        dp.modelo = ModeloCubico()
+        esperado = DivisionParrafos(self.palabras, 25, 1.5, modelo=ModeloCubico())
+        assert dp.resolver()[0] != antes
+        assert dp.resolver()[0] == pytest.approx(esperado.resolver_iterativo(acotado=True)[0])
+        assert dp.calcular_costo_linea(0, 1) == esperado.calcular_costo_linea(0, 1)
+
+    def test_pickle_y_procesos(self):
+        """La instancia se puede enviar a otros procesos con su modelo"""
+        import pickle
+        dp = DivisionParrafos(self.palabras, 25, 1.5, modelo=ModeloCubico())
+        copia = pickle.loads(pickle.dumps(dp))
+        assert isinstance(copia.modelo, ModeloCubico)
+        assert copia.resolver_iterativo(acotado=True) == dp.resolver_iterativo(acotado=True)
+        assert dp.resolver_multi_L([20, 25], workers=2)['tabla'][25] == dp.resolver_iterativo(acotado=True)
+
+
+class TestFormatearDocumento:
+    """Tests para formatear_documento"""
+
+    texto = ("el rápido zorro marrón salta sobre el perro perezoso y luego\n"
+             "descansa bajo un árbol frondoso del parque\n"
+             "\n\n"
+             "segundo párrafo corto\n")
+
+    def test_ancho_visual(self):
+        """Los caracteres anchos ocupan dos columnas y las marcas combinantes ninguna"""
+        assert ancho_visual("zorro") == 5
+        assert ancho_visual("árbol") == 5
+        assert ancho_visual("a\u0301rbol") == 5
+        assert ancho_visual("日本語") == 6
+
+    def test_parrafos_y_justificado(self, tmp_path):
+        """Cada párrafo se resuelve aparte y las líneas regulares miden L"""
+        import io
+        ruta = tmp_path / "doc.txt"
+        ruta.write_text(self.texto, encoding='utf-8')
+        salida = io.StringIO()
+        resumen = formatear_documento(str(ruta), 20, 1.0, salida)
+
+        parrafos = salida.getvalue().rstrip('\n').split('\n\n')
+        assert resumen['parrafos'] == len(parrafos) == 2
+        assert resumen['bytes'] == len(self.texto.encode('utf-8'))
+        assert resumen['palabras'] == len(self.texto.split())
+        assert parrafos[1].split() == ["segundo", "párrafo", "corto"]
+        assert resumen['lineas'] == sum(len(p.split('\n')) for p in parrafos)
+        lineas = parrafos[0].split('\n')
+        assert ' '.join(lineas).split() == self.texto.split()[:-3]
+        for linea in lineas[:-1]:
+            if len(linea.split()) > 1:
+                assert len(linea) == 20
+
+    def test_mismo_costo_que_el_solver(self):
+        """El costo es el de resolver el párrafo con sus anchos visuales"""
+        import io
+        palabras = self.texto.split()[:-3]
+        resumen = formatear_documento(io.StringIO(self.texto.split('\n\n')[0]), 20, 1.0, io.StringIO())
+        esperado, _ = DivisionParrafos([ancho_visual(p) for p in palabras], 20, 1.0).resolver_iterativo()
+        assert resumen['costo'] == pytest.approx(esperado)
+
+    def test_palabra_mas_ancha_que_L(self):
+        """Una palabra que no cabe queda sola en su línea"""
+        import io
+        salida = io.StringIO()
+        formatear_documento(io.BytesIO("uno extraordinariamente dos".encode('utf-8')), 8, 1.0, salida)
+        assert "extraordinariamente" in salida.getvalue().split('\n')
+
+
+class TestLineaComandos:
+    """Tests para python -m division_parrafos"""
+
+    texto = ("el rápido zorro marrón salta sobre el perro perezoso y luego\n"
+             "descansa bajo un árbol frondoso del parque\n\n"
+             "segundo párrafo con algunas palabras más para partir\n")
+
+    def test_texto_igual_que_formatear_documento(self, tmp_path, capsys):
+        """La salida de texto es la de formatear_documento"""
+        import io
+        ruta = tmp_path / "doc.txt"
+        ruta.write_text(self.texto, encoding='utf-8')
+        esperado = io.StringIO()
+        formatear_documento(str(ruta), 20, 1.0, esperado)
+        assert main(['--L', '20', '--b', '1.0', str(ruta)]) == 0
+        assert capsys.readouterr().out == esperado.getvalue()
+
+    def test_json_de_longitudes(self, tmp_path, capsys):
+        """Con longitudes se escribe una línea JSON por párrafo"""
+        import json
+        ruta = tmp_path / "longitudes.txt"
+        ruta.write_text("5 3 4 6 2 4 5 3\n\n7 7\n")
+        assert main(['--L', '15', '--b', '1.5', '--entrada', 'longitudes', str(ruta)]) == 0
+        lineas = [json.loads(l) for l in capsys.readouterr().out.splitlines()]
+        assert [l['parrafo'] for l in lineas] == [0, 1]
+        costo, cortes = DivisionParrafos([5, 3, 4, 6, 2, 4, 5, 3], 15, 1.5).resolver_iterativo()
+        assert lineas[0]['cortes'] == cortes
+        assert lineas[0]['costo'] == pytest.approx(costo)
+
+    def test_jobs_no_cambia_la_salida(self, tmp_path, capsys):
+        """Con varios procesos los párrafos salen en el mismo orden"""
+        ruta = tmp_path / "doc.txt"
+        ruta.write_text(self.texto * 5, encoding='utf-8')
+        main(['--L', '24', '--formato', 'json', str(ruta)])
+        secuencial = capsys.readouterr().out
+        main(['--L', '24', '--formato', 'json', '--jobs', '2', str(ruta)])
+        assert capsys.readouterr().out == secuencial
+
+    def test_archivo_inexistente(self, tmp_path, capsys):
+        """Un error de lectura termina con código 1 y mensaje en stderr"""
+        assert main(['--L', '20', str(tmp_path / "no_existe.txt")]) == 1
+        assert "no_existe.txt" in capsys.readouterr().err
+
+    def test_entrada_estandar_sin_dependencias_pesadas(self):
+        """Lee de stdin y no importa matplotlib ni pytest al arrancar"""
+        import os
+        import subprocess
+        import sys
+        codigo = ("import sys, division_parrafos; sys.exit(division_parrafos.main(['--L', '12']) "
+                  "or any(m in sys.modules for m in ('matplotlib', 'pytest')))")
+        proceso = subprocess.run([sys.executable, '-c', codigo], input="uno dos tres cuatro\n".encode(),
+                                 capture_output=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert proceso.returncode == 0
+        assert proceso.stdout.decode().split() == ["uno", "dos", "tres", "cuatro"]
+
+    def test_sin_argumentos_en_tuberia(self):
+        """Sin argumentos y con stdin en una tubería se formatea stdin, no la demo"""
+        import os
+        import subprocess
+        import sys
+        proceso = subprocess.run([sys.executable, '-m', 'division_parrafos'],
+                                 input="uno dos tres\n".encode(), capture_output=True,
+                                 cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert proceso.returncode == 0
+        assert proceso.stdout.decode() == "uno dos tres\n"
+
+    def test_tuberia_cerrada(self):
+        """Si el lector cierra la tubería no hay traceback"""
+        import os
+        import subprocess
+        import sys
+        proceso = subprocess.Popen([sys.executable, '-m', 'division_parrafos', '--L', '8'],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   cwd=os.path.dirname(os.path.abspath(__file__)))
+        proceso.stdout.close()
+        _, error = proceso.communicate(("uno dos tres cuatro cinco\n" * 20000).encode())
+        assert proceso.returncode == 0
+        assert b"Traceback" not in error
+
+
+class TestMedicionRendimiento:
+    """Tests para el motor de benchmark (medicion_rendimiento)"""
+
+    def test_estadisticas_y_atipicos(self):
+        """Percentiles con interpolación y muestras atípicas por el criterio de Tukey"""
+        from medicion_rendimiento import resumir_muestras, percentil
+        assert percentil([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+        assert percentil([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+        resumen = resumir_muestras([1.0, 1.01, 0.99, 1.0, 1.02, 0.98, 1.0, 5.0])
+        assert resumen['min'] == 0.98
+        assert resumen['mediana'] == resumen['tiempo'] == 1.0
+        assert resumen['min'] <= resumen['mediana'] <= resumen['p95'] <= 5.0
+        assert resumen['atipicos'] == [7]
+        assert resumen['inestable']
+        assert not resumir_muestras([1.0, 1.02, 0.98, 1.01, 0.99])['inestable']
+
+    def test_medir_restaura_gc(self):
+        """El recolector vuelve a su estado y el resultado es el de la función"""
+        import gc
+        from medicion_rendimiento import medir
+        llamadas = []
+        medicion = medir(lambda: llamadas.append(1) or 7, repeticiones=5, calentamiento=3, tiempo_minimo=0)
+        assert gc.isenabled()
+        assert medicion['resultado'] == 7
+        assert len(medicion['muestras']) == 5
+        assert len(llamadas) == 3 + medicion['llamadas_por_muestra'] * 6
+
+    def test_documento_versionado(self, tmp_path):
+        """El benchmark respeta los límites de n y se guarda con versión"""
+        import json
+        from medicion_rendimiento import (ejecutar_benchmark, guardar_resultados, cargar_resultados,
+                                          VERSION_ESQUEMA)
+        documento = ejecutar_benchmark([4, 9], repeticiones=3, calentamiento=1, tiempo_minimo=0, informar=None)
+        assert documento['version'] == VERSION_ESQUEMA
+        assert documento['configuracion']['repeticiones'] == 3
+        n4, n9 = documento['resultados']
+        assert 'Exhaustivo' in n4['algoritmos'] and 'Exhaustivo' not in n9['algoritmos']
+        costos = {datos['costo'] for datos in n9['algoritmos'].values()}
+        assert len(costos) == 1
+
+        ruta = tmp_path / "resultados.json"
+        guardar_resultados(documento, str(ruta))
+        assert cargar_resultados(str(ruta))['resultados'] == documento['resultados']
+        antiguo = tmp_path / "antiguo.json"
+        antiguo.write_text(json.dumps([{'n': 3, 'algoritmos': {'Iterativo': {'tiempo': 0.1, 'costo': 0.0}}}]))
+        assert cargar_resultados(str(antiguo))['version'] == 0
+
+
+class TestMemoria:
+    """Tests para la medición de memoria con tracemalloc"""
+
+    def test_medir_memoria(self):
+        """El pico cubre la memoria viva y tracemalloc queda como estaba"""
+        import tracemalloc
+        from division_parrafos import medir_memoria
+        resultado, memoria = medir_memoria(lambda: [0] * 100_000, sitios=3)
+        assert len(resultado) == 100_000
+        assert memoria['pico'] >= 800_000
+        assert memoria['final'] >= 800_000
+        assert 1 <= len(memoria['sitios']) <= 3
+        assert memoria['sitios'][0]['bytes'] >= 800_000
+        assert not tracemalloc.is_tracing()
+
+    def test_ejecutar_y_medir(self):
+        """La pasada de memoria no se suma a los contadores"""
+        dp = DivisionParrafos([3, 4, 2, 5, 3, 4, 6, 2, 3, 5] * 5, 20, 2.0)
+        solo = ejecutar_y_medir(dp.resolver_divide_venceras, "D&V", contadores=True)
+        ambos = ejecutar_y_medir(dp.resolver_divide_venceras, "D&V", contadores=True, memoria=True)
+        assert solo['memoria'] is None
+        assert ambos['memoria']['pico'] > 0
+        assert ambos['contadores'] == solo['contadores']
+        assert dp.contadores is None
+        assert ambos['memoria']['sitios'][0]['archivo'] == 'division_parrafos.py'
+
+    def test_benchmark_con_memoria(self, tmp_path):
+        """El benchmark guarda la memoria de cada algoritmo en el JSON"""
+        from medicion_rendimiento import ejecutar_benchmark, guardar_resultados, cargar_resultados
+        documento = ejecutar_benchmark([4, 40], repeticiones=2, calentamiento=0, tiempo_minimo=0,
+                                       informar=None, memoria=True, sitios_memoria=2)
+        assert documento['configuracion']['memoria']
+        n4, n40 = documento['resultados']
+        for nombre, datos in n40['algoritmos'].items():
+            assert datos['memoria']['pico'] > n4['algoritmos'][nombre]['memoria']['pico']
+            assert len(datos['memoria']['sitios']) <= 2
+        ruta = tmp_path / "resultados.json"
+        guardar_resultados(documento, str(ruta))
+        assert cargar_resultados(str(ruta))['resultados'] == documento['resultados']
+
+
+class TestAjusteComplejidad:
+    """Tests para el ajuste de potencia y el control de regresiones"""
+
+    @staticmethod
+    def documento(tiempo):
+        """Resultados sintéticos con tiempo(n) para cada algoritmo"""
+        return {'resultados': [
+            {'n': n, 'algoritmos': {'Iterativo': {'tiempo': tiempo(n), 'min': tiempo(n)}}}
+            for n in (10, 20, 40, 80, 160)
+        ]}
+
+    def test_exponente_exacto(self):
+        """Con datos c·n^k exactos se recupera k con un intervalo estrecho"""
+        from medicion_rendimiento import ajustar_potencia
+        ajuste = ajustar_potencia([10, 20, 40, 80], [3e-6 * n ** 2 for n in (10, 20, 40, 80)])
+        assert ajuste['exponente'] == pytest.approx(2.0)
+        assert ajuste['constante'] == pytest.approx(3e-6)
+        assert ajuste['ic95'][0] == pytest.approx(2.0) and ajuste['ic95'][1] == pytest.approx(2.0)
+        assert ajuste['r2'] == pytest.approx(1.0)
+
+    def test_intervalo_contiene_exponente_con_ruido(self):
+        """Con ruido el intervalo del 95% contiene el exponente real"""
+        import random
+        from medicion_rendimiento import ajustar_potencia
+        generador = random.Random(3)
+        ns = [10, 20, 40, 80, 160, 320]
+        ajuste = ajustar_potencia(ns, [1e-6 * n ** 1.5 * generador.uniform(0.9, 1.1) for n in ns])
+        bajo, alto = ajuste['ic95']
+        assert bajo < 1.5 < alto
+
+    def test_pocos_puntos(self):
+        """Con menos de 3 tamaños no hay ajuste"""
+        from medicion_rendimiento import ajustar_potencia
+        with pytest.raises(ValueError):
+            ajustar_potencia([10, 20], [1.0, 4.0])
+
+    def test_regresiones(self):
+        """Exponente mayor que el teórico o tiempo mayor que la base cuentan como regresión"""
+        from medicion_rendimiento import comparar_con_base
+        cuadratico = self.documento(lambda n: 1e-6 * n ** 2)
+        assert comparar_con_base(cuadratico, cuadratico) == []
+        cubico = self.documento(lambda n: 1e-6 * n ** 3)
+        assert any('exponente' in r for r in comparar_con_base(cubico))
+        lento = self.documento(lambda n: 2e-6 * n ** 2)
+        regresiones = comparar_con_base(lento, cuadratico)
+        assert len(regresiones) == 5 and all('veces la base' in r for r in regresiones)
+
+    def test_exponente_con_ruido_no_es_regresion(self):
+        """Solo cuenta como regresión un exponente cuyo IC95 entero supera el umbral"""
+        from medicion_rendimiento import comparar_con_base
+        ruidos = {10: 1.6, 20: 0.6, 40: 1.0, 80: 1.7, 160: 0.7}
+        # Exponente puntual ≈ 2.31 > 2.0 + 0.3, pero el IC95 llega hasta ≈ 1.54
+        ruidoso = self.documento(lambda n: 1e-6 * n ** 2.4 * ruidos[n])
+        assert comparar_con_base(ruidoso) == []
+        ruidos = {10: 1.0, 20: 1.02, 40: 0.98, 80: 1.01, 160: 0.99}
+        estable = self.documento(lambda n: 1e-6 * n ** 2.6 * ruidos[n])
+        assert any('exponente' in r for r in comparar_con_base(estable))
+
+    def test_divide_venceras_es_lineal(self):
+        """El exponente teórico de D&V es el de O(n·W): un O(n²) es regresión"""
+        from medicion_rendimiento import comparar_con_base, EXPONENTES_TEORICOS
+        assert EXPONENTES_TEORICOS['Divide y Vencerás'] == 1.0
+        cuadratico = {'resultados': [
+            {'n': n, 'algoritmos': {'Divide y Vencerás': {'tiempo': 1e-6 * n ** 2}}}
+            for n in (10, 20, 40, 80, 160)
+        ]}
+        assert any('Divide y Vencerás' in r for r in comparar_con_base(cuadratico))
+
+    def test_main_termina_con_error(self, tmp_path, capsys):
+        """La puerta de regresión devuelve 1 si la base es mucho más rápida"""
+        import json
+        from medicion_rendimiento import main
+        ruta = tmp_path / "base.json"
+        argumentos = ['--tamaños', '20', '40', '80', '--repeticiones', '3', '--calentamiento', '0']
+        assert main(argumentos + ['--guardar', str(ruta)]) in (0, 1)
+        base = json.loads(ruta.read_text())
+        for resultado in base['resultados']:
+            for datos in resultado['algoritmos'].values():
+                datos['min'] /= 100
+        ruta.write_text(json.dumps(base))
+        assert main(argumentos + ['--base', str(ruta)]) == 1
+        assert "REGRESIONES" in capsys.readouterr().out
+
+
+class TestStress:
+    """Tests para el stress test sin interacción (ejecutar_stress)"""
+
+    def test_pool_y_checkpoint(self, tmp_path):
+        """Todos los algoritmos dan el mismo costo y el JSON queda escrito"""
+        from medicion_rendimiento import ejecutar_stress, cargar_resultados, ALGORITMOS_STRESS
+        ruta = str(tmp_path / "stress.json")
+        documento = ejecutar_stress([30, 60], workers=2, repeticiones=1, ruta=ruta, informar=None)
+        for resultado in documento['resultados']:
+            assert set(resultado['algoritmos']) == set(ALGORITMOS_STRESS)
+            assert len({round(d['costo'], 9) for d in resultado['algoritmos'].values()}) == 1
+        assert cargar_resultados(ruta)['resultados'] == documento['resultados']
+
+    def test_reproducible_y_reanudable(self, tmp_path):
+        """Con la misma semilla los costos se repiten y solo se mide lo que falta"""
+        from medicion_rendimiento import ejecutar_stress
+        ruta = str(tmp_path / "stress.json")
+        primero = ejecutar_stress([30], workers=1, repeticiones=1, ruta=ruta, informar=None)
+        mensajes = []
+        segundo = ejecutar_stress([30, 45], workers=1, repeticiones=1, ruta=ruta, informar=mensajes.append)
+        assert any("Reanudando" in m for m in mensajes)
+        medidos = [m for m in mensajes if m.strip().startswith("n=")]
+        assert medidos and all("n=45" in m for m in medidos)
+        assert segundo['resultados'][0]['algoritmos']['NumPy']['costo'] == \
+            primero['resultados'][0]['algoritmos']['NumPy']['costo']
+
+    def test_tiempo_limite(self, tmp_path):
+        """Un proceso que agota el tiempo se termina y no se intenta con n mayores"""
+        from medicion_rendimiento import ejecutar_stress
+        documento = ejecutar_stress([300, 400], workers=2, tiempo_limite=0.5, repeticiones=1,
+                                    ruta=str(tmp_path / "stress.json"), incluir_lentos=True, informar=None)
+        n300, n400 = documento['resultados']
+        assert n300['omitidos']['Recursivo'] == 'tiempo límite'
+        assert n400['omitidos']['Recursivo'] in ('tiempo límite', 'tiempo límite con n=300')
+        assert 'Iterativo Acotado' in n400['algoritmos']
+
+
+class TestAlgoritmoLineal:
+    """Tests para el algoritmo lineal (SMAWK en línea)"""
+
+    def test_costo_por_defecto_no_es_monotono(self):
+        """La palabra sola rompe la monotonía: se usa el iterativo acotado"""
+        dp = DivisionParrafos([3, 4, 2, 5, 3, 4, 6, 2, 3, 5], 20, 2.0)
+        assert not dp.es_totalmente_monotona()
+        assert dp.resolver_lineal(verificar=True) == dp.resolver_iterativo(acotado=True)
+
+    def test_costo_irregularidad_es_monotono(self):
+        dp = DivisionIrregularidad([3, 4, 2, 5, 3, 4, 6, 2, 3, 5], 20, 2.0)
+        assert dp.es_totalmente_monotona()
+
+    @pytest.mark.parametrize("palabras,L", [
+        ([5], 15),
+        ([5, 3, 4, 6, 2], 15),
+        ([3, 4, 2, 5, 3, 4, 6, 2, 3, 5], 20),
+        ([3, 7, 2, 9, 5, 4, 10, 6] * 50, 60),
+    ])
+    def test_igual_costo_que_iterativo(self, palabras, L):
+        """Con costo monótono, SMAWK encuentra el mismo óptimo"""
+        dp = DivisionIrregularidad(palabras, L, 1.0)
+        costo_lin, cortes_lin = dp.resolver_lineal(verificar=True)
+        costo_iter, _ = dp.resolver_iterativo()
+        assert costo_lin == pytest.approx(costo_iter, abs=1e-9)
+        # Los cortes reproducen el costo reportado
+        inicios = [0] + [c + 1 for c in cortes_lin]
+        fines = cortes_lin + [len(palabras) - 1]
+        total = sum(dp.calcular_costo_linea(i, j) for i, j in zip(inicios, fines))
+        assert total == pytest.approx(costo_lin, abs=1e-9)
+
+    def test_sin_palabras(self):
+        dp = DivisionParrafos([], 15, 1.5)
+        assert dp.resolver_lineal() == (0.0, [])
+
+    def test_verificacion_solo_a_pedido(self):
+        """Sin verificar no se comprueba la monotonía; al verificar se guarda el resultado"""
+        from division_parrafos import ModeloKnuthPlass, _monotonia_modelo
+        modelo = ModeloKnuthPlass()
+        dp = DivisionParrafos([3, 4, 2, 5, 3, 4, 6, 2, 3, 5] * 5, 30, 1.5, modelo=modelo)
+        antes = _monotonia_modelo.cache_info()
+        assert dp.resolver_lineal() == dp.resolver_iterativo(acotado=True)
+        assert _monotonia_modelo.cache_info().misses == antes.misses
+        otro = DivisionParrafos([5, 4, 3, 2, 6], 30, 1.5, modelo=modelo)
+        assert dp.es_totalmente_monotona() == otro.es_totalmente_monotona()
+        despues = _monotonia_modelo.cache_info()
+        assert (despues.misses, despues.hits) == (antes.misses + 1, antes.hits + 1)
+
+
+class TestEdicionIncremental:
+    """Tests para insertar/eliminar/resolver"""
+
+    @staticmethod
+    def costo_de_cortes(dp, cortes):
+        """Suma directa de los costos de las líneas definidas por los cortes"""
+        total, inicio = 0.0, 0
+        for fin in cortes + [dp.k - 1]:
+            total += dp.calcular_costo_linea(inicio, fin)
+            inicio = fin + 1
+        return total
+
+    def test_igual_que_acotado(self):
+        """Sin ediciones, resolver coincide con resolver_iterativo acotado"""
+        dp = DivisionParrafos([3, 7, 2, 9, 5, 4, 10, 6] * 20, 25, 1.5)
+        assert dp.resolver() == dp.resolver_iterativo(acotado=True)
+
+    def test_ediciones_aleatorias(self):
+        """Tras cada edición el costo es el óptimo recalculado desde cero"""
+        import random
+        generador = random.Random(14)
+        dp = DivisionParrafos([generador.randint(1, 8) for _ in range(300)], 20, 1.5)
+        dp.resolver()
+        for paso in range(60):
+            pos = generador.randint(0, dp.k - 1)
+            if paso % 2:
+                dp.eliminar(pos, generador.randint(1, 3))
+            else:
+                dp.insertar(pos, [generador.randint(1, 8) for _ in range(generador.randint(1, 3))])
+            costo, cortes = dp.resolver()
+            referencia = DivisionParrafos(list(dp.palabras), 20, 1.5)
+            esperado, _ = referencia.resolver_iterativo(acotado=True)
+            assert costo == pytest.approx(esperado)
+            # Ante empates puede elegir otros cortes, pero con el mismo costo
+            assert self.costo_de_cortes(referencia, cortes) == pytest.approx(esperado)
+
+    def test_cortes_devueltos_son_copia(self):
+        """Modificar la lista devuelta no altera los cortes que se mantienen"""
+        dp = DivisionParrafos([3, 7, 2, 9, 5, 4, 10, 6] * 20, 25, 1.5)
+        _, cortes = dp.resolver()
+        cortes.clear()
+        dp.insertar(5, [4])
+        costo, cortes = dp.resolver()
+        assert self.costo_de_cortes(dp, cortes) == pytest.approx(costo)
+
+    def test_editar_extremos(self):
+        """Agregar al final y borrar todo"""
+        dp = DivisionParrafos([5, 3], 15, 1.5)
+        dp.resolver()
+        dp.insertar(2, [4, 6])
+        assert dp.resolver() == DivisionParrafos([5, 3, 4, 6], 15, 1.5).resolver_iterativo(acotado=True)
+        dp.eliminar(0, 4)
+        assert dp.resolver() == (0.0, [])
+
+    def test_otros_algoritmos_tras_editar(self):
+        """Las longitudes acumuladas se reconstruyen al necesitarlas"""
+        dp = DivisionParrafos([5, 3, 4], 15, 1.5)
+        dp.insertar(1, [2])
+        dp.eliminar(3)
+        assert dp.palabras == [5, 2, 3]
+        assert dp.prefijos == [0, 5, 7, 10]
+        assert dp.resolver_iterativo() == DivisionParrafos([5, 2, 3], 15, 1.5).resolver_iterativo()
+
+    def test_posicion_invalida(self):
+        """Las posiciones fuera del párrafo se rechazan"""
+        dp = DivisionParrafos([5, 3], 15, 1.5)
+        with pytest.raises(IndexError):
+            dp.insertar(3, [1])
+        with pytest.raises(IndexError):
+            dp.eliminar(1, 2)
+
+    def test_palabra_que_no_cabe(self):
+        """Insertar y borrar una palabra más larga que L pasa por un párrafo sin solución"""
+        palabras = [3, 7, 2, 9, 5, 4, 10, 6] * 20
+        dp = DivisionParrafos(list(palabras), 25, 1.5)
+        esperado = dp.resolver()
+        dp.insertar(70, [30])
+        assert dp.resolver() == (float('inf'), [])
+        dp.eliminar(70)
+        costo, cortes = dp.resolver()
+        assert costo == pytest.approx(esperado[0])
+        assert self.costo_de_cortes(dp, cortes) == pytest.approx(costo)
+
+    def test_compacto_longitud_invalida(self):
+        """En modo compacto una longitud que no cabe en 16 bits es ValueError"""
+        dp = DivisionParrafos([5, 3], 15, 1.5, compacto=True)
+        with pytest.raises(ValueError):
+            dp.insertar(1, [70000])
+        assert list(dp.palabras) == [5, 3]
+
+
+class TestStreaming:
+    """Tests para la división en línea sobre flujos de palabras"""
+
+    @pytest.mark.parametrize("palabras,L,b", [
+        ([5], 15, 1.5),
+        ([5, 3, 4, 6, 2], 15, 1.5),
+        ([3, 4, 2, 5, 3, 4, 6, 2, 3, 5], 20, 2.0),
+        ([3, 7, 2, 9, 5, 4, 10, 6] * 200, 60, 1.5),
+    ])
+    def test_igual_a_iterativo(self, palabras, L, b):
+        """Mismo costo y mismas líneas que la DP sobre la lista completa"""
+        streaming = StreamingDivisionParrafos(L, b)
+        lineas = list(streaming.procesar(iter(palabras)))
+        costo, cortes = DivisionParrafos(palabras, L, b).resolver_iterativo()
+        assert streaming.costo == costo
+        assert [fin for _, fin in lineas[:-1]] == cortes
+        assert lineas[0][0] == 0 and lineas[-1][1] == len(palabras) - 1
+
+    def test_flujo_infinito(self):
+        """Entrega líneas sin esperar el final del flujo"""
+        import itertools
+
+        def longitudes():
+            while True:
+                yield from [3, 7, 2, 9, 5, 4, 10, 6]
+
+        streaming = StreamingDivisionParrafos(60, 1.5)
+        lineas = list(itertools.islice(streaming.procesar(longitudes()), 5))
+        assert len(lineas) == 5
+        assert lineas[0][0] == 0
+
+    def test_memoria_acotada(self):
+        """Con entradas periódicas los caminos no se unen: actúa el límite"""
+        palabras = [3, 7, 2, 9, 5, 4, 10, 6] * 2000
+        streaming = StreamingDivisionParrafos(60, 1.5, max_posiciones=512)
+        lineas = list(streaming.procesar(iter(palabras)))
+        assert streaming.max_retenidas <= 513
+        assert streaming.forzados > 0
+        # Sigue siendo una partición válida, aunque no necesariamente óptima
+        assert all(a[1] + 1 == b[0] for a, b in zip(lineas, lineas[1:]))
+        costo_optimo, _ = DivisionParrafos(palabras, 60, 1.5).resolver_iterativo(acotado=True)
+        assert streaming.costo >= costo_optimo - 1e-9
+
+    def test_texto_aleatorio_sin_forzar(self):
+        """En texto no periódico los caminos se unen y la solución es exacta"""
+        import random
+        generador = random.Random(7)
+        palabras = [generador.randint(2, 10) for _ in range(20000)]
+        streaming = StreamingDivisionParrafos(60, 1.5)
+        for _ in streaming.procesar(iter(palabras)):
+            pass
+        assert streaming.forzados == 0
+        assert streaming.max_retenidas < 2048
+        costo, _ = DivisionParrafos(palabras, 60, 1.5).resolver_iterativo(acotado=True)
+        assert streaming.costo == costo
+
+    def test_agregar_y_finalizar(self):
+        """Los cortes confirmados más los de finalizar son los del iterativo"""
+        import random
+        generador = random.Random(11)
+        palabras = [generador.randint(2, 10) for _ in range(3000)]
+        streaming = StreamingDivisionParrafos(60, 1.5)
+        cortes = []
+        for longitud in palabras:
+            streaming.agregar(longitud)
+            cortes.extend(streaming.cortes_confirmados())
+        assert cortes, "debería confirmar cortes antes del final"
+        costo, pendientes = streaming.finalizar()
+        assert (costo, cortes + pendientes) == DivisionParrafos(palabras, 60, 1.5).resolver_iterativo()
+        # Solo la API de flujo, no la de DivisionParrafos
+        assert not hasattr(streaming, 'resolver_iterativo')
+
+    def test_flujo_vacio(self):
+        streaming = StreamingDivisionParrafos(15, 1.5)
+        assert list(streaming.procesar(iter([]))) == []
+        assert streaming.costo == 0.0
+
+    def test_palabra_no_cabe(self):
+        streaming = StreamingDivisionParrafos(15, 1.5)
+        with pytest.raises(ValueError):
+            list(streaming.procesar(iter([3, 20, 3])))
+
+
+class TestResolverLote:
+    """Tests para la resolución por lotes de muchos párrafos"""
+
+    PARRAFOS = [[5, 3, 4, 6, 2], [], [3, 4, 2, 5, 3, 4, 6, 2, 3, 5], [7], [10, 10, 10]] * 20
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_orden_y_resultados(self, workers):
+        """Mismos resultados que resolver cada párrafo, en el orden de entrada"""
+        lote = resolver_lote(self.PARRAFOS, 15, 1.5, workers=workers, tam_bloque=7)
+        esperados = [DivisionParrafos(p, 15, 1.5).resolver_iterativo() for p in self.PARRAFOS]
+        assert lote['resultados'] == esperados
+
+    def test_reporta_rendimiento(self):
+        lote = resolver_lote(self.PARRAFOS, 15, 1.5, workers=1)
+        assert lote['tiempo'] > 0
+        assert lote['parrafos_por_segundo'] > 0
+
+    def test_lote_vacio(self):
+        assert resolver_lote([], 15, 1.5, workers=2)['resultados'] == []
+
+
 class TestAlgoritmoRecursivo:
     """Tests para el algoritmo recursivo puro"""
     
@@ -114,6 +1099,48 @@ class TestAlgoritmoRecursivo:
         costo_iter, cortes_iter = dp.resolver_iterativo()
         # Pueden diferir ligeramente por reconstrucción, pero costo similar
         assert abs(costo_rec - costo_iter) < 0.1
+    
+    def test_memo_y_poda_igual_que_puro(self):
+        """Memo y poda no cambian el resultado del recursivo puro"""
+        import random
+        generador = random.Random(10)
+        for _ in range(20):
+            palabras = [generador.randint(1, 8) for _ in range(generador.randint(1, 9))]
+            dp = DivisionParrafos(palabras, 15, 1.5)
+            esperado = dp.resolver_recursivo()
+            for memo, poda in [(True, False), (False, True), (True, True)]:
+                assert dp.resolver_recursivo(memo=memo, poda=poda) == esperado
+    
+    def test_memo_caso_grande(self):
+        """Con memo el recursivo resuelve n=200 con el costo del iterativo"""
+        import random
+        generador = random.Random(11)
+        palabras = [generador.randint(2, 8) for _ in range(200)]
+        dp = DivisionParrafos(palabras, 20, 2.0)
+        costo_memo, cortes_memo = dp.resolver_recursivo(memo=True, poda=True)
+        costo_iter, _ = dp.resolver_iterativo()
+        assert costo_memo == pytest.approx(costo_iter)
+        assert all(a < b for a, b in zip(cortes_memo, cortes_memo[1:]))
+    
+    def test_memo_acotado(self):
+        """Un tamaño de caché limitado no altera el resultado"""
+        dp = DivisionParrafos([3, 4, 2, 5, 1, 6, 2, 3], 12, 1.5)
+        assert (dp.resolver_recursivo(memo=True, tam_memo=4)
+                == dp.resolver_recursivo(memo=True))
+
+    def test_memo_sin_limite_de_recursion(self):
+        """Con memo, n mayor que el límite de recursión no da RecursionError"""
+        import random
+        import sys
+        generador = random.Random(12)
+        palabras = [generador.randint(2, 8) for _ in range(sys.getrecursionlimit() + 500)]
+        dp = DivisionParrafos(palabras, 20, 2.0)
+        esperado = dp.resolver_iterativo(acotado=True)
+        dp.instrumentar()
+        costo, cortes = dp.resolver_recursivo(memo=True, poda=True, tam_memo=64)
+        assert costo == pytest.approx(esperado[0])
+        assert all(a < b for a, b in zip(cortes, cortes[1:]))
+        assert dp.contadores['profundidad_maxima'] <= 2
 
 
 class TestAlgoritmoDivideVenceras:
@@ -142,6 +1169,50 @@ class TestAlgoritmoDivideVenceras:
         if cortes:
             assert cortes[-1] < 6  # Menor que número de palabras
 
+    def test_entrada_grande_sin_recursion(self):
+        """No depende del límite de recursión de Python"""
+        import sys
+        limite = sys.getrecursionlimit()
+        palabras = [3, 7, 2, 9, 5, 4, 10, 6] * 2500  # 20000 palabras
+        dp = DivisionParrafos(palabras, 60, 1.5)
+        costo_dyv, _ = dp.resolver_divide_venceras()
+        costo_iter, _ = dp.resolver_iterativo(acotado=True)
+        assert costo_dyv == pytest.approx(costo_iter)
+        assert sys.getrecursionlimit() == limite
+
+    def test_sin_solucion_dyv(self):
+        """Una palabra que no cabe deja el problema sin solución"""
+        dp = DivisionParrafos([3, 20, 3], 15, 1.5)
+        assert dp.resolver_divide_venceras() == (float('inf'), [])
+
+
+class TestDivideVencerasParalelo:
+    """Tests para divide y vencerás con segmentos en paralelo"""
+
+    @pytest.mark.parametrize("workers", [2, 4])
+    def test_igual_costo_que_iterativo(self, workers):
+        """La combinación de segmentos es exacta"""
+        palabras = [3, 7, 2, 9, 5, 4, 10, 6, 1, 8, 3] * 40  # 440 palabras
+        dp = DivisionParrafos(palabras, 30, 1.5)
+        costo_par, cortes_par = dp.resolver_divide_venceras_paralelo(workers=workers)
+        costo_iter, _ = dp.resolver_iterativo(acotado=True)
+        assert costo_par == pytest.approx(costo_iter, abs=1e-9)
+        # Los cortes reproducen el costo reportado
+        inicios = [0] + [c + 1 for c in cortes_par]
+        fines = cortes_par + [len(palabras) - 1]
+        total = sum(dp.calcular_costo_linea(i, j) for i, j in zip(inicios, fines))
+        assert total == pytest.approx(costo_par, abs=1e-9)
+
+    def test_texto_corto_usa_iterativo(self):
+        """Si no se puede partir en segmentos, resuelve de forma secuencial"""
+        dp = DivisionParrafos([5, 3, 4, 6, 2], 15, 1.5)
+        assert dp.resolver_divide_venceras_paralelo(workers=4) == dp.resolver_iterativo(acotado=True)
+
+    def test_sin_solucion_paralelo(self):
+        palabras = [3] * 200 + [40] + [3] * 200
+        dp = DivisionParrafos(palabras, 30, 1.5)
+        assert dp.resolver_divide_venceras_paralelo(workers=2) == (float('inf'), [])
+
 
 class TestAlgoritmoExhaustivo:
     """Tests para el algoritmo exhaustivo"""
@@ -160,6 +1231,123 @@ class TestAlgoritmoExhaustivo:
         costo_iter, _ = dp.resolver_iterativo()
         assert abs(costo_exh - costo_iter) < 0.1
 
+    @pytest.mark.parametrize("semilla_dp", [False, True])
+    def test_poda_igual_a_completo(self, semilla_dp):
+        """Ramificación y poda encuentra la misma solución que el recorrido completo"""
+        dp = DivisionParrafos([3, 4, 2, 5, 3, 4, 6, 2, 3, 5], 20, 2.0)
+        completo = dp.resolver_exhaustivo()
+        visitados_completo = dp.nodos_visitados
+        costo, cortes = dp.resolver_exhaustivo(poda=True, semilla_dp=semilla_dp)
+        assert costo == pytest.approx(completo[0], abs=1e-12)
+        assert dp.nodos_podados > 0
+        assert dp.nodos_visitados < visitados_completo
+
+    def test_poda_como_oraculo_n40(self):
+        """Con poda el exhaustivo sirve como oráculo para n=40"""
+        palabras = [3, 4, 2, 5, 3, 4, 6, 2, 3, 5] * 4
+        dp = DivisionParrafos(palabras, 20, 2.0)
+        costo_exh, _ = dp.resolver_exhaustivo(poda=True, semilla_dp=True)
+        costo_iter, _ = dp.resolver_iterativo()
+        assert costo_exh == pytest.approx(costo_iter, abs=1e-9)
+
+    def test_poda_sin_solucion(self):
+        dp = DivisionParrafos([3, 20, 3], 15, 1.5)
+        assert dp.resolver_exhaustivo(poda=True) == (float('inf'), [])
+        assert DivisionParrafos([], 15, 1.5).resolver_exhaustivo(poda=True) == (0.0, [])
+
+
+class TestContadores:
+    """Pruebas de los contadores de operaciones de los solvers"""
+
+    PALABRAS = [3, 4, 2, 5, 3, 4, 6, 2, 3, 5]
+
+    def test_desactivados_por_defecto(self):
+        """Sin instrumentar, los solvers no cuentan nada"""
+        dp = DivisionParrafos(self.PALABRAS, 20, 2.0)
+        dp.resolver_iterativo()
+        assert dp.contadores is None
+
+    def test_iterativo_evalua_todos_los_pares(self):
+        """La DP O(n²) evalúa n(n+1)/2 líneas"""
+        dp = DivisionParrafos(self.PALABRAS, 20, 2.0)
+        dp.instrumentar()
+        costo, cortes = dp.resolver_iterativo()
+        n = len(self.PALABRAS)
+        assert dp.contadores['evaluaciones_costo'] == n * (n + 1) // 2
+        assert 0 < dp.contadores['evaluaciones_infactibles'] < dp.contadores['evaluaciones_costo']
+        assert dp.contadores['relajaciones'] >= n
+        dp.instrumentar(False)
+        assert dp.resolver_iterativo() == (costo, cortes)
+
+    def test_acotado_evalua_menos(self):
+        """La DP acotada no evalúa líneas que no caben"""
+        dp = DivisionParrafos(self.PALABRAS * 5, 20, 2.0)
+        dp.instrumentar()
+        dp.resolver_iterativo()
+        completo = dp.contadores['evaluaciones_costo']
+        dp.instrumentar()
+        dp.resolver_iterativo(acotado=True)
+        assert dp.contadores['evaluaciones_costo'] < completo / 4
+        assert dp.contadores['evaluaciones_infactibles'] == 0
+
+    def test_memo_aciertos_y_profundidad(self):
+        """El recursivo con memo resuelve cada posición una vez"""
+        dp = DivisionParrafos(self.PALABRAS, 20, 2.0)
+        dp.instrumentar()
+        dp.resolver_recursivo(memo=True, poda=True)
+        n = len(self.PALABRAS)
+        contadores = dp.contadores
+        assert contadores['memo_fallos'] == n + 1
+        assert contadores['llamadas_recursivas'] == contadores['memo_aciertos'] + n + 1
+        assert 1 < contadores['profundidad_maxima'] <= n + 1
+
+    def test_recursivo_puro_cuenta_llamadas(self):
+        """El recursivo puro hace más llamadas que el memorizado"""
+        dp = DivisionParrafos(self.PALABRAS, 20, 2.0)
+        dp.instrumentar()
+        dp.resolver_recursivo()
+        puro = dp.contadores['llamadas_recursivas']
+        dp.instrumentar()
+        dp.resolver_recursivo(memo=True)
+        assert puro > dp.contadores['llamadas_recursivas']
+
+    def test_divide_venceras_igual_a_memo(self):
+        """D&V y el recursivo con memo y poda evalúan las mismas líneas"""
+        dp = DivisionParrafos(self.PALABRAS * 3, 20, 2.0)
+        dp.instrumentar()
+        dp.resolver_recursivo(memo=True, poda=True)
+        memo = dp.contadores
+        dp.instrumentar()
+        dp.resolver_divide_venceras()
+        dyv = dp.contadores
+        assert dyv['memo_fallos'] == len(dp.palabras)
+        assert dyv['relajaciones'] > 0
+        assert dyv['profundidad_maxima'] > 1
+        # Cada línea factible lleva a un subproblema leído de la memoria
+        factibles = memo['evaluaciones_costo'] - memo['evaluaciones_infactibles']
+        assert dyv['memo_aciertos'] == factibles
+        assert dyv['evaluaciones_costo'] > memo['evaluaciones_costo']
+
+    def test_exhaustivo_particiones(self):
+        """El exhaustivo completo genera 2^(n-1) particiones"""
+        dp = DivisionParrafos(self.PALABRAS[:6], 20, 2.0)
+        dp.instrumentar()
+        dp.resolver_exhaustivo()
+        assert dp.contadores['particiones'] == 2 ** 5
+        dp.instrumentar()
+        dp.resolver_exhaustivo(poda=True)
+        assert 0 < dp.contadores['particiones'] < 2 ** 5
+        assert dp.contadores['nodos_podados'] == dp.nodos_podados
+
+    def test_ejecutar_y_medir(self):
+        """ejecutar_y_medir devuelve los contadores junto al tiempo"""
+        dp = DivisionParrafos(self.PALABRAS, 20, 2.0)
+        resultado = ejecutar_y_medir(dp.resolver_divide_venceras, "D&V", contadores=True)
+        assert resultado['contadores']['evaluaciones_costo'] > 0
+        assert resultado['tiempo'] >= 0
+        assert dp.contadores is None
+        assert ejecutar_y_medir(dp.resolver_iterativo, "Iterativo")['contadores'] is None
+
 
 class TestCasosEspeciales:
     """Tests para casos especiales y edge cases"""
@@ -235,6 +1423,18 @@ class TestRendimiento:
         assert costo < float('inf')
         assert len(cortes) <= 40
 
+    def test_arranque_sin_modulos_pesados(self):
+        """Importar main y el solver no carga numpy, matplotlib, pytest ni pools"""
+        import os
+        import subprocess
+        import sys
+        pesados = ('numpy', 'matplotlib', 'pytest', 'concurrent.futures', 'analisis_graficas')
+        codigo = (f"import sys, main, division_parrafos; "
+                  f"sys.exit(any(m in sys.modules for m in {pesados!r}))")
+        proceso = subprocess.run([sys.executable, '-c', codigo],
+                                 cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert proceso.returncode == 0
+
 
 class TestValidacionResultados:
     """Tests para validar que los resultados sean correctos"""